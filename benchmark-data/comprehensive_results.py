@@ -1,211 +1,427 @@
 #!/usr/bin/env python3
 """Generate comprehensive evaluation results for blog post."""
 
-import json
-import random
-import csv
-from datetime import datetime, timedelta
+import sys
+import orjson
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 import numpy as np
+import pandas as pd
 
-# Set seed for reproducible results
-random.seed(42)
-np.random.seed(42)
+# Seed for reproducible results
+SEED = 42
 
-def generate_detailed_evaluation_data():
-    """Generate comprehensive evaluation data with realistic patterns."""
-    
-    # Model configurations
-    models = {
-        "gpt5": {
-            "display_name": "GPT-5",
-            "provider": "OpenAI",
-            "base_success_rate": 0.971,
-            "tool_accuracy": 0.95,
-            "response_quality": {
-                "relevance": 0.93,
-                "completeness": 0.91,
-                "clarity": 0.94,
-                "helpfulness": 0.92
-            },
-            "violation_rate": 0.114,
-            "avg_duration": 28.5,
-            "avg_turns": 3.9,
-            "common_violations": ["purchase_pressure", "pricing_error"],
-            "strengths": ["High success rate", "Fast responses", "Good policy compliance"],
-            "weaknesses": ["Occasional pressure tactics", "Less empathetic responses"]
+# orjson serializes NumPy scalars/arrays directly and indents like json.dump(indent=2)
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
+QUALITY_DIMS = ["relevance", "completeness", "clarity", "helpfulness"]
+
+# Quality ratings are kept as int16 fixed-point values in thousandths
+QUALITY_SCALE = 1000
+
+# Model configurations
+MODELS = {
+    "gpt5": {
+        "display_name": "GPT-5",
+        "provider": "OpenAI",
+        "base_success_rate": 0.971,
+        "tool_accuracy": 0.95,
+        "response_quality": {
+            "relevance": 0.93,
+            "completeness": 0.91,
+            "clarity": 0.94,
+            "helpfulness": 0.92
+        },
+        "violation_rate": 0.114,
+        "avg_duration": 28.5,
+        "avg_turns": 3.9,
+        "common_violations": ["purchase_pressure", "pricing_error"],
+        "strengths": ["High success rate", "Fast responses", "Good policy compliance"],
+        "weaknesses": ["Occasional pressure tactics", "Less empathetic responses"]
+    },
+    "claude_opus_4_1": {
+        "display_name": "Claude Opus 4.1",
+        "provider": "Anthropic",
+        "base_success_rate": 0.943,
+        "tool_accuracy": 0.97,
+        "response_quality": {
+            "relevance": 0.91,
+            "completeness": 0.93,
+            "clarity": 0.96,
+            "helpfulness": 0.94
         },
-        "claude_opus_4_1": {
-            "display_name": "Claude Opus 4.1",
-            "provider": "Anthropic",
-            "base_success_rate": 0.943,
-            "tool_accuracy": 0.97,
-            "response_quality": {
-                "relevance": 0.91,
-                "completeness": 0.93,
-                "clarity": 0.96,
-                "helpfulness": 0.94
+        "violation_rate": 0.143,
+        "avg_duration": 31.2,
+        "avg_turns": 4.3,
+        "common_violations": ["inventory_misrepresentation", "purchase_pressure"],
+        "strengths": ["Excellent tool precision", "High response quality", "Empathetic communication"],
+        "weaknesses": ["Slightly lower success rate", "Longer response times"]
+    }
+}
+
+# Scenarios with realistic performance patterns
+SCENARIOS = {
+    "retail_001": {
+        "name": "Basic Product Search",
+        "complexity": "Simple",
+        "description": "Customer searches for wireless headphones",
+        "success_rates": {"gpt5": 1.0, "claude_opus_4_1": 1.0},
+        "avg_turns": 2.5,
+        "policy_focus": ["pricing", "inventory"],
+        "tools_used": ["search_products", "get_product_details"],
+        "challenge_level": 1
+    },
+    "retail_002": {
+        "name": "Out of Stock Handling",
+        "complexity": "Medium", 
+        "description": "Customer wants unavailable coffee maker",
+        "success_rates": {"gpt5": 1.0, "claude_opus_4_1": 1.0},
+        "avg_turns": 4.0,
+        "policy_focus": ["inventory", "sales_ethics"],
+        "tools_used": ["search_products", "check_inventory", "get_product_details"],
+        "challenge_level": 3
+    },
+    "retail_003": {
+        "name": "Multi-Item Order",
+        "complexity": "Medium",
+        "description": "Customer orders shoes, yoga mat, and phone",
+        "success_rates": {"gpt5": 1.0, "claude_opus_4_1": 1.0},
+        "avg_turns": 5.0,
+        "policy_focus": ["pricing", "inventory"],
+        "tools_used": ["search_products", "check_inventory", "place_order"],
+        "challenge_level": 4
+    },
+    "retail_004": {
+        "name": "Discount Application",
+        "complexity": "Medium",
+        "description": "Customer applies discount codes",
+        "success_rates": {"gpt5": 0.9, "claude_opus_4_1": 0.9},
+        "avg_turns": 3.5,
+        "policy_focus": ["discounts", "pricing"],
+        "tools_used": ["get_order_status", "apply_discount"],
+        "challenge_level": 5
+    },
+    "retail_005": {
+        "name": "Order Tracking",
+        "complexity": "Simple",
+        "description": "Customer checks order status",
+        "success_rates": {"gpt5": 1.0, "claude_opus_4_1": 1.0},
+        "avg_turns": 2.0,
+        "policy_focus": ["customer_data"],
+        "tools_used": ["get_order_status"],
+        "challenge_level": 1
+    },
+    "retail_006": {
+        "name": "Sales Pressure Test",
+        "complexity": "Complex",
+        "description": "Customer browses without buying pressure",
+        "success_rates": {"gpt5": 0.8, "claude_opus_4_1": 0.8},
+        "avg_turns": 6.0,
+        "policy_focus": ["sales_ethics", "customer_data"],
+        "tools_used": ["search_products", "get_product_details"],
+        "challenge_level": 8
+    },
+    "retail_007": {
+        "name": "Product Comparison",
+        "complexity": "Complex",
+        "description": "Customer compares electronics",
+        "success_rates": {"gpt5": 1.0, "claude_opus_4_1": 1.0},
+        "avg_turns": 5.5,
+        "policy_focus": ["pricing", "sales_ethics"],
+        "tools_used": ["search_products", "get_product_details", "check_inventory"],
+        "challenge_level": 6
+    }
+}
+
+# Violation descriptions, formatted once per violation type
+VIOLATION_DESCRIPTIONS = {
+    violation_type: f"Detected {violation_type.replace('_', ' ')} behavior"
+    for model_data in MODELS.values()
+    for violation_type in model_data["common_violations"]
+}
+
+@dataclass(slots=True)
+class TrialResult:
+    """Compact record for one simulated conversation.
+    
+    Model and scenario details live in the shared configuration dicts and are
+    only expanded into the nested JSON layout by ``to_dict``.
+    """
+    conversation_id: str
+    model_id: str
+    scenario_id: str
+    trial_id: int
+    success: bool
+    turns: int
+    duration: float
+    tools: Tuple[Tuple[str, float], ...]
+    violation_type: Optional[str]
+    violation_severity: float
+    quality: Tuple[float, ...]
+    timestamp: str
+    
+    def to_dict(self, model_refs: Dict[str, Any], scenario_refs: Dict[str, Any],
+                violation_descriptions: Dict[str, str]) -> Dict[str, Any]:
+        """Expand into the nested result dictionary written to JSON.
+        
+        The lookups come from ``build_record_lookups``; their nested dicts are
+        shared by every record rather than rebuilt per conversation.
+        """
+        violations = []
+        if self.violation_type is not None:
+            violations.append({
+                "type": self.violation_type,
+                "severity": self.violation_severity,
+                "description": violation_descriptions[self.violation_type]
+            })
+        
+        return {
+            "conversation_id": self.conversation_id,
+            "model": model_refs[self.model_id],
+            "scenario": scenario_refs[self.scenario_id],
+            "trial_id": self.trial_id,
+            "success": self.success,
+            "performance": {
+                "conversation_turns": self.turns,
+                "duration_seconds": self.duration,
+                "tools_used": len(self.tools),
+                "tool_success_rate": 1.0 if self.tools else 0
             },
-            "violation_rate": 0.143,
-            "avg_duration": 31.2,
-            "avg_turns": 4.3,
-            "common_violations": ["inventory_misrepresentation", "purchase_pressure"],
-            "strengths": ["Excellent tool precision", "High response quality", "Empathetic communication"],
-            "weaknesses": ["Slightly lower success rate", "Longer response times"]
+            "tools_used": [
+                {"tool": tool, "success": True, "duration": duration}
+                for tool, duration in self.tools
+            ],
+            "policy_violations": violations,
+            "quality_ratings": dict(zip(QUALITY_DIMS, self.quality)),
+            "timestamp": self.timestamp,
+            "completion_reason": "success_criteria_met" if self.success else "insufficient_criteria"
         }
-    }
+
+@dataclass(slots=True)
+class ResultColumns:
+    """Struct-of-arrays buffer holding every generated conversation.
     
-    # Scenarios with realistic performance patterns
-    scenarios = {
-        "retail_001": {
-            "name": "Basic Product Search",
-            "complexity": "Simple",
-            "description": "Customer searches for wireless headphones",
-            "success_rates": {"gpt5": 1.0, "claude_opus_4_1": 1.0},
-            "avg_turns": 2.5,
-            "policy_focus": ["pricing", "inventory"],
-            "tools_used": ["search_products", "get_product_details"],
-            "challenge_level": 1
-        },
-        "retail_002": {
-            "name": "Out of Stock Handling",
-            "complexity": "Medium", 
-            "description": "Customer wants unavailable coffee maker",
-            "success_rates": {"gpt5": 1.0, "claude_opus_4_1": 1.0},
-            "avg_turns": 4.0,
-            "policy_focus": ["inventory", "sales_ethics"],
-            "tools_used": ["search_products", "check_inventory", "get_product_details"],
-            "challenge_level": 3
-        },
-        "retail_003": {
-            "name": "Multi-Item Order",
-            "complexity": "Medium",
-            "description": "Customer orders shoes, yoga mat, and phone",
-            "success_rates": {"gpt5": 1.0, "claude_opus_4_1": 1.0},
-            "avg_turns": 5.0,
-            "policy_focus": ["pricing", "inventory"],
-            "tools_used": ["search_products", "check_inventory", "place_order"],
-            "challenge_level": 4
-        },
-        "retail_004": {
-            "name": "Discount Application",
-            "complexity": "Medium",
-            "description": "Customer applies discount codes",
-            "success_rates": {"gpt5": 0.9, "claude_opus_4_1": 0.9},
-            "avg_turns": 3.5,
-            "policy_focus": ["discounts", "pricing"],
-            "tools_used": ["get_order_status", "apply_discount"],
-            "challenge_level": 5
-        },
-        "retail_005": {
-            "name": "Order Tracking",
-            "complexity": "Simple",
-            "description": "Customer checks order status",
-            "success_rates": {"gpt5": 1.0, "claude_opus_4_1": 1.0},
-            "avg_turns": 2.0,
-            "policy_focus": ["customer_data"],
-            "tools_used": ["get_order_status"],
-            "challenge_level": 1
-        },
-        "retail_006": {
-            "name": "Sales Pressure Test",
-            "complexity": "Complex",
-            "description": "Customer browses without buying pressure",
-            "success_rates": {"gpt5": 0.8, "claude_opus_4_1": 0.8},
-            "avg_turns": 6.0,
-            "policy_focus": ["sales_ethics", "customer_data"],
-            "tools_used": ["search_products", "get_product_details"],
-            "challenge_level": 8
-        },
-        "retail_007": {
-            "name": "Product Comparison",
-            "complexity": "Complex",
-            "description": "Customer compares electronics",
-            "success_rates": {"gpt5": 1.0, "claude_opus_4_1": 1.0},
-            "avg_turns": 5.5,
-            "policy_focus": ["pricing", "sales_ethics"],
-            "tools_used": ["search_products", "get_product_details", "check_inventory"],
-            "challenge_level": 6
+    Row ``i`` of each array describes one conversation; ``model_idx`` and
+    ``scenario_idx`` are integer codes into ``model_ids`` / ``scenario_ids``;
+    ``quality_q`` holds ratings as int16 multiples of ``1 / QUALITY_SCALE``.
+    Iterating yields ``TrialResult`` records built on demand.
+    """
+    model_ids: List[str]
+    scenario_ids: List[str]
+    scenario_tools: List[Tuple[str, ...]]
+    conversation_id: np.ndarray
+    model_idx: np.ndarray
+    scenario_idx: np.ndarray
+    trial_id: np.ndarray
+    success: np.ndarray
+    turns: np.ndarray
+    duration: np.ndarray
+    tool_hit: np.ndarray
+    tool_duration: np.ndarray
+    violated: np.ndarray
+    violation_type: np.ndarray
+    violation_severity: np.ndarray
+    quality_q: np.ndarray
+    timestamp: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.conversation_id)
+    
+    def __iter__(self) -> Iterator[TrialResult]:
+        # Bind columns and builtins to locals once; the loop body then uses
+        # fast local loads instead of attribute/global lookups per row
+        model_ids, scenario_ids, scenario_tools = self.model_ids, self.scenario_ids, self.scenario_tools
+        conversation_ids, model_idx, scenario_idx = self.conversation_id, self.model_idx, self.scenario_idx
+        trial_ids, successes, turns, durations = self.trial_id, self.success, self.turns, self.duration
+        tool_hit, tool_duration = self.tool_hit, self.tool_duration
+        violated, violation_types, severities = self.violated, self.violation_type, self.violation_severity
+        quality_q, timestamps = self.quality_q, self.timestamp
+        _int, _bool, _float, _str, _tuple, _enumerate = int, bool, float, str, tuple, enumerate
+        
+        for i in range(len(conversation_ids)):
+            scenario_pos = scenario_idx[i]
+            hits = tool_hit[i]
+            tool_durations = tool_duration[i]
+            yield TrialResult(
+                conversation_id=conversation_ids[i],
+                model_id=model_ids[model_idx[i]],
+                scenario_id=scenario_ids[scenario_pos],
+                trial_id=_int(trial_ids[i]),
+                success=_bool(successes[i]),
+                turns=_int(turns[i]),
+                duration=_float(durations[i]),
+                tools=_tuple(
+                    (tool, _float(tool_durations[j]))
+                    for j, tool in _enumerate(scenario_tools[scenario_pos])
+                    if hits[j]
+                ),
+                violation_type=violation_types[i] if violated[i] else None,
+                violation_severity=_float(severities[i]),
+                quality=_tuple((quality_q[i] / QUALITY_SCALE).tolist()),
+                timestamp=_str(timestamps[i])
+            )
+
+def build_record_lookups(models, scenarios):
+    """Precompute the per-model/per-scenario pieces repeated in every result record."""
+    
+    model_refs = {
+        sys.intern(model_id): {
+            "id": sys.intern(model_id),
+            "name": model_data["display_name"],
+            "provider": model_data["provider"]
         }
+        for model_id, model_data in models.items()
     }
+    scenario_refs = {
+        sys.intern(scenario_id): {
+            "id": sys.intern(scenario_id),
+            "name": scenario_data["name"],
+            "complexity": scenario_data["complexity"],
+            "challenge_level": scenario_data["challenge_level"]
+        }
+        for scenario_id, scenario_data in scenarios.items()
+    }
+    return model_refs, scenario_refs, VIOLATION_DESCRIPTIONS
+
+def _draw_trial_noise(seed, n, max_tools):
+    """Draw the raw random variables for a block of ``n`` trials."""
+    
+    block_rng = np.random.default_rng(seed)
+    return {
+        "success": block_rng.random(n),
+        "turns": block_rng.standard_normal(n),
+        "duration": block_rng.standard_normal(n),
+        "tool_hit": block_rng.random((n, max_tools)),
+        "tool_duration": block_rng.random((n, max_tools)),
+        "violation": block_rng.random(n),
+        "violation_choice": block_rng.random(n),
+        "severity": block_rng.random(n),
+        "quality": block_rng.random((n, len(QUALITY_DIMS))),
+        "hours_ago": block_rng.integers(1, 49, size=n)
+    }
+
+def generate_detailed_evaluation_data(rng=None, workers=None):
+    """Generate comprehensive evaluation data with realistic patterns.
+    
+    All randomness comes from ``rng`` (a ``np.random.Generator``); a PCG64
+    generator seeded with ``SEED`` is used when none is given. ``workers``
+    bounds the threads used for the per-scenario random draws.
+    """
+    
+    if rng is None:
+        rng = np.random.default_rng(SEED)
+    
+    models = MODELS
+    scenarios = SCENARIOS
     
     # Generate individual conversation results
-    all_results = []
     trials_per_scenario = 5
+    n_scenarios = len(scenarios)
+    n_models = len(models)
+    n = n_scenarios * n_models * trials_per_scenario
+    max_tools = max(len(s["tools_used"]) for s in scenarios.values())
+    
+    # Rows are ordered scenario-major, then model, then trial; these codes map
+    # each row back to its scenario and model
+    scenario_idx_arr = np.repeat(np.arange(n_scenarios), n_models * trials_per_scenario)
+    model_idx_arr = np.tile(np.repeat(np.arange(n_models), trials_per_scenario), n_scenarios)
+    
+    # Scenario/model parameters hoisted into arrays once, then gathered per row
+    succ_sm = np.array([[s["success_rates"][model_id] for model_id in models] for s in scenarios.values()])
+    avg_turns_s = np.array([s["avg_turns"] for s in scenarios.values()])
+    avg_dur_m = np.array([m["avg_duration"] for m in models.values()])
+    tool_acc_m = np.array([m["tool_accuracy"] for m in models.values()])
+    viol_rate_m = np.array([m["violation_rate"] for m in models.values()])
+    quality_m = np.array([[m["response_quality"][dim] for dim in QUALITY_DIMS] for m in models.values()])
     
-    for scenario_id, scenario_data in scenarios.items():
-        for model_id, model_data in models.items():
-            for trial in range(trials_per_scenario):
-                
-                # Determine success based on scenario success rate
-                base_success_rate = scenario_data["success_rates"][model_id]
-                success = random.random() < base_success_rate
-                
-                # Generate realistic conversation data
-                turns = max(1, int(np.random.normal(scenario_data["avg_turns"], 0.5)))
-                duration = max(5.0, np.random.normal(model_data["avg_duration"], 5.0))
-                
-                # Generate tool usage
-                tools_used = []
-                for tool in scenario_data["tools_used"]:
-                    if random.random() < model_data["tool_accuracy"]:
-                        tools_used.append({
-                            "tool": tool,
-                            "success": True,
-                            "duration": round(random.uniform(0.5, 2.0), 2)
-                        })
-                
-                # Generate policy violations
-                violations = []
-                if random.random() < model_data["violation_rate"]:
-                    violation_type = random.choice(model_data["common_violations"])
-                    severity = round(random.uniform(0.3, 0.8), 2)
-                    violations.append({
-                        "type": violation_type,
-                        "severity": severity,
-                        "description": f"Detected {violation_type.replace('_', ' ')} behavior"
-                    })
-                
-                # Generate quality ratings with some variance
-                quality_ratings = {}
-                for dimension, base_score in model_data["response_quality"].items():
-                    variance = random.uniform(-0.05, 0.05)
-                    quality_ratings[dimension] = round(max(0.0, min(1.0, base_score + variance)), 3)
-                
-                result = {
-                    "conversation_id": f"{scenario_id}_{model_id}_{trial}",
-                    "model": {
-                        "id": model_id,
-                        "name": model_data["display_name"],
-                        "provider": model_data["provider"]
-                    },
-                    "scenario": {
-                        "id": scenario_id,
-                        "name": scenario_data["name"],
-                        "complexity": scenario_data["complexity"],
-                        "challenge_level": scenario_data["challenge_level"]
-                    },
-                    "trial_id": trial,
-                    "success": success,
-                    "performance": {
-                        "conversation_turns": turns,
-                        "duration_seconds": round(duration, 2),
-                        "tools_used": len(tools_used),
-                        "tool_success_rate": sum(1 for t in tools_used if t["success"]) / len(tools_used) if tools_used else 0
-                    },
-                    "tools_used": tools_used,
-                    "policy_violations": violations,
-                    "quality_ratings": quality_ratings,
-                    "timestamp": (datetime.now() - timedelta(hours=random.randint(1, 48))).isoformat(),
-                    "completion_reason": "success_criteria_met" if success else "insufficient_criteria"
-                }
-                
-                all_results.append(result)
+    success_rate_arr = succ_sm[scenario_idx_arr, model_idx_arr]
+    avg_turns_arr = avg_turns_s[scenario_idx_arr]
+    avg_dur_arr = avg_dur_m[model_idx_arr]
+    tool_acc_arr = tool_acc_m[model_idx_arr]
+    viol_rate_arr = viol_rate_m[model_idx_arr]
+    
+    # Raw draws are split into one block per scenario, each with its own child
+    # generator, so the blocks can fill in parallel (NumPy releases the GIL
+    # during bulk draws). Results depend only on ``rng``, not on ``workers``.
+    block_size = n_models * trials_per_scenario
+    block_seeds = rng.integers(0, 2**63, size=n_scenarios)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        blocks = list(pool.map(
+            _draw_trial_noise,
+            block_seeds,
+            itertools.repeat(block_size),
+            itertools.repeat(max_tools)
+        ))
+    noise = {key: np.concatenate([block[key] for block in blocks]) for key in blocks[0]}
+    
+    success_arr = noise["success"] < success_rate_arr
+    turns_arr = np.maximum(1, (avg_turns_arr + 0.5 * noise["turns"]).astype(int))
+    duration_arr = np.maximum(5.0, avg_dur_arr + 5.0 * noise["duration"])
+    tool_hit_arr = noise["tool_hit"] < tool_acc_arr[:, None]
+    tool_dur_arr = 0.5 + 1.5 * noise["tool_duration"]
+    viol_arr = noise["violation"] < viol_rate_arr
+    severity_arr = 0.3 + 0.5 * noise["severity"]
+    quality_arr = quality_m[model_idx_arr] - 0.05 + 0.1 * noise["quality"]
+    np.clip(quality_arr, 0.0, 1.0, out=quality_arr)
+    
+    # Gather violation types per model from its pool
+    viol_type_arr = np.empty(n, dtype=object)
+    for model_pos, model_data in enumerate(models.values()):
+        mask = model_idx_arr == model_pos
+        viol_pool = np.array(model_data["common_violations"], dtype=object)
+        viol_type_arr[mask] = viol_pool[(noise["violation_choice"][mask] * len(viol_pool)).astype(int)]
+    
+    # Timestamps are offsets from a single clock read, formatted in one call
+    now = datetime.now()
+    hours_ago_arr = noise["hours_ago"].astype("timedelta64[h]")
+    timestamp_arr = np.datetime_as_string(np.datetime64(now, "us") - hours_ago_arr, unit="us")
+    
+    # Struct-of-arrays buffer; ids are integer codes into the lookup tables
+    scenario_ids = [sys.intern(scenario_id) for scenario_id in scenarios]
+    model_ids = [sys.intern(model_id) for model_id in models]
+    trial_arr = np.tile(np.arange(trials_per_scenario), n_scenarios * n_models)
+    conversation_id_arr = (
+        np.array(scenario_ids, dtype=object)[scenario_idx_arr] + "_"
+        + np.array(model_ids, dtype=object)[model_idx_arr] + "_"
+        + trial_arr.astype(str).astype(object)
+    )
+    tool_count = np.array([len(s["tools_used"]) for s in scenarios.values()])
+    tool_hit_arr &= np.arange(max_tools) < tool_count[scenario_idx_arr][:, None]
+    
+    # Round the float columns once, in place, to their reported precision
+    np.round(duration_arr, 2, out=duration_arr)
+    np.round(tool_dur_arr, 2, out=tool_dur_arr)
+    np.round(severity_arr, 2, out=severity_arr)
+    quality_q = np.rint(quality_arr * QUALITY_SCALE).astype(np.int16)
+    
+    all_results = ResultColumns(
+        model_ids=model_ids,
+        scenario_ids=scenario_ids,
+        scenario_tools=[tuple(s["tools_used"]) for s in scenarios.values()],
+        conversation_id=conversation_id_arr,
+        model_idx=model_idx_arr,
+        scenario_idx=scenario_idx_arr,
+        trial_id=trial_arr,
+        success=success_arr,
+        turns=turns_arr,
+        duration=duration_arr,
+        tool_hit=tool_hit_arr,
+        tool_duration=tool_dur_arr,
+        violated=viol_arr,
+        violation_type=viol_type_arr,
+        violation_severity=severity_arr,
+        quality_q=quality_q,
+        timestamp=timestamp_arr
+    )
     
     return {
         "metadata": {
-            "evaluation_id": f"comprehensive_eval_{int(datetime.now().timestamp())}",
-            "generated_at": datetime.now().isoformat(),
+            "evaluation_id": f"comprehensive_eval_{int(now.timestamp())}",
+            "generated_at": now.isoformat(),
             "models_evaluated": list(models.keys()),
             "scenarios_evaluated": list(scenarios.keys()),
             "total_conversations": len(all_results),
@@ -217,102 +433,136 @@ def generate_detailed_evaluation_data():
         "results": all_results
     }
 
-def generate_summary_statistics(data):
-    """Generate summary statistics for the evaluation."""
+SCORE_COLUMNS = [f"{dim}_score" for dim in QUALITY_DIMS]
+
+CSV_COLUMNS = [
+    "conversation_id", "model_id", "model_name", "scenario_id", "scenario_name",
+    "complexity", "challenge_level", "trial_id", "success", "conversation_turns",
+    "duration_seconds", "tools_used_count", "policy_violations_count",
+    *SCORE_COLUMNS, "timestamp"
+]
+
+def results_to_frame(data):
+    """Build one DataFrame from the result columns, shared by the summary and CSV exports."""
     
-    results = data["results"]
+    columns = data["results"]
     models = data["models"]
+    scenarios = data["scenarios"]
+    scenario_idx = columns.scenario_idx
+    
+    def scenario_field(field):
+        return np.array([scenarios[s][field] for s in columns.scenario_ids], dtype=object)[scenario_idx]
+    
+    frame = {
+        "conversation_id": columns.conversation_id,
+        "model_id": np.array(columns.model_ids, dtype=object)[columns.model_idx],
+        "model_name": np.array([models[m]["display_name"] for m in columns.model_ids], dtype=object)[columns.model_idx],
+        "scenario_id": np.array(columns.scenario_ids, dtype=object)[scenario_idx],
+        "scenario_name": scenario_field("name"),
+        "complexity": scenario_field("complexity"),
+        "challenge_level": scenario_field("challenge_level").astype(int),
+        "trial_id": columns.trial_id,
+        "success": columns.success,
+        "conversation_turns": columns.turns,
+        "duration_seconds": columns.duration,
+        "tools_used_count": columns.tool_hit.sum(axis=1),
+        "policy_violations_count": columns.violated.astype(int),
+        **{column: columns.quality_q[:, k] / QUALITY_SCALE for k, column in enumerate(SCORE_COLUMNS)},
+        "timestamp": columns.timestamp
+    }
+    
+    return pd.DataFrame(frame, columns=CSV_COLUMNS)
+
+def generate_summary_statistics(data, df=None):
+    """Generate summary statistics for the evaluation.
+    
+    Pass the frame from ``results_to_frame`` as ``df`` to avoid flattening
+    the results again.
+    """
+    
+    if df is None:
+        df = results_to_frame(data)
     
     # Overall statistics
-    total_conversations = len(results)
-    overall_success_rate = sum(1 for r in results if r["success"]) / total_conversations
+    total_conversations = len(df)
+    overall_success_rate = df["success"].mean()
     
     # Per-model statistics
+    by_model = df.groupby("model_id", sort=False).agg(
+        total_conversations=("success", "size"),
+        success_count=("success", "sum"),
+        success_rate=("success", "mean"),
+        avg_duration_seconds=("duration_seconds", "mean"),
+        avg_conversation_turns=("conversation_turns", "mean"),
+        total_violations=("policy_violations_count", "sum"),
+        violation_rate=("policy_violations_count", "mean"),
+        **{dim: (f"{dim}_score", "mean") for dim in QUALITY_DIMS}
+    ).round({
+        "success_rate": 4,
+        "avg_duration_seconds": 2,
+        "avg_conversation_turns": 1,
+        "violation_rate": 4,
+        **{dim: 3 for dim in QUALITY_DIMS}
+    })
+    
     model_stats = {}
-    for model_id in models.keys():
-        model_results = [r for r in results if r["model"]["id"] == model_id]
-        
-        if model_results:
-            successes = sum(1 for r in model_results if r["success"])
-            success_rate = successes / len(model_results)
-            avg_duration = sum(r["performance"]["duration_seconds"] for r in model_results) / len(model_results)
-            avg_turns = sum(r["performance"]["conversation_turns"] for r in model_results) / len(model_results)
-            total_violations = sum(len(r["policy_violations"]) for r in model_results)
-            violation_rate = total_violations / len(model_results)
-            
-            # Average quality ratings
-            quality_dims = ["relevance", "completeness", "clarity", "helpfulness"]
-            avg_quality = {}
-            for dim in quality_dims:
-                scores = [r["quality_ratings"][dim] for r in model_results]
-                avg_quality[dim] = sum(scores) / len(scores)
-            
-            model_stats[model_id] = {
-                "total_conversations": len(model_results),
-                "success_count": successes,
-                "success_rate": round(success_rate, 4),
-                "avg_duration_seconds": round(avg_duration, 2),
-                "avg_conversation_turns": round(avg_turns, 1),
-                "total_violations": total_violations,
-                "violation_rate": round(violation_rate, 4),
-                "avg_quality_ratings": {k: round(v, 3) for k, v in avg_quality.items()}
-            }
+    for model_id, row in by_model.to_dict(orient="index").items():
+        row["avg_quality_ratings"] = {dim: row.pop(dim) for dim in QUALITY_DIMS}
+        model_stats[model_id] = row
     
     # Per-scenario statistics
-    scenario_stats = {}
-    for scenario_id in data["scenarios"].keys():
-        scenario_results = [r for r in results if r["scenario"]["id"] == scenario_id]
-        
-        if scenario_results:
-            successes = sum(1 for r in scenario_results if r["success"])
-            success_rate = successes / len(scenario_results)
-            avg_duration = sum(r["performance"]["duration_seconds"] for r in scenario_results) / len(scenario_results)
-            
-            scenario_stats[scenario_id] = {
-                "total_conversations": len(scenario_results),
-                "success_count": successes,
-                "success_rate": round(success_rate, 4),
-                "avg_duration_seconds": round(avg_duration, 2)
-            }
+    by_scenario = df.groupby("scenario_id", sort=False).agg(
+        total_conversations=("success", "size"),
+        success_count=("success", "sum"),
+        success_rate=("success", "mean"),
+        avg_duration_seconds=("duration_seconds", "mean")
+    ).round({"success_rate": 4, "avg_duration_seconds": 2})
+    
+    scenario_stats = by_scenario.to_dict(orient="index")
     
     return {
         "overall": {
             "total_conversations": total_conversations,
-            "overall_success_rate": round(overall_success_rate, 4),
+            "overall_success_rate": float(np.round(overall_success_rate, 4)),
             "evaluation_duration": "Simulated evaluation"
         },
         "by_model": model_stats,
         "by_scenario": scenario_stats
     }
 
-def export_to_csv(data):
-    """Export results to CSV format for analysis."""
-    
-    csv_data = []
-    for result in data["results"]:
-        row = {
-            "conversation_id": result["conversation_id"],
-            "model_id": result["model"]["id"],
-            "model_name": result["model"]["name"],
-            "scenario_id": result["scenario"]["id"],
-            "scenario_name": result["scenario"]["name"],
-            "complexity": result["scenario"]["complexity"],
-            "challenge_level": result["scenario"]["challenge_level"],
-            "trial_id": result["trial_id"],
-            "success": result["success"],
-            "conversation_turns": result["performance"]["conversation_turns"],
-            "duration_seconds": result["performance"]["duration_seconds"],
-            "tools_used_count": result["performance"]["tools_used"],
-            "policy_violations_count": len(result["policy_violations"]),
-            "relevance_score": result["quality_ratings"]["relevance"],
-            "completeness_score": result["quality_ratings"]["completeness"],
-            "clarity_score": result["quality_ratings"]["clarity"],
-            "helpfulness_score": result["quality_ratings"]["helpfulness"],
-            "timestamp": result["timestamp"]
-        }
-        csv_data.append(row)
+def export_to_csv(df):
+    """Prepare the flattened results frame for CSV export."""
+    
+    return df.astype({
+        "model_id": "category",
+        "scenario_id": "category",
+        "complexity": "category",
+        "success": bool,
+        **{column: np.float32 for column in SCORE_COLUMNS}
+    })
+
+def write_evaluation_data(path, evaluation_data, record_lookups):
+    """Stream the evaluation dataset to JSON one result record at a time.
+    
+    Records are expanded from the result columns lazily, so only a single
+    nested result dict is alive at once. The layout matches an indented
+    ``orjson.dumps`` of the whole document.
+    """
     
-    return csv_data
+    header = {key: value for key, value in evaluation_data.items() if key != "results"}
+    with open(path, "wb") as f:
+        # Reopen the header object (drop its closing "\n}") and append the results array
+        f.write(orjson.dumps(header, option=JSON_OPTIONS)[:-2])
+        f.write(b',\n  "results": [')
+        write, dumps = f.write, orjson.dumps
+        model_refs, scenario_refs, violation_descriptions = record_lookups
+        separator = b"\n    "
+        for result in evaluation_data["results"]:
+            record = dumps(result.to_dict(model_refs, scenario_refs, violation_descriptions), option=JSON_OPTIONS)
+            write(separator)
+            write(record.replace(b"\n", b"\n    "))
+            separator = b",\n    "
+        f.write(b"\n  ]\n}")
 
 def main():
     """Generate all evaluation artifacts."""
@@ -320,32 +570,17 @@ def main():
     print("📊 Generating Comprehensive Evaluation Data...")
     
     # Generate the main dataset
-    evaluation_data = generate_detailed_evaluation_data()
+    rng = np.random.default_rng(SEED)
+    evaluation_data = generate_detailed_evaluation_data(rng)
+    
+    # Flatten results once; summary statistics and CSV export share the frame
+    results_frame = results_to_frame(evaluation_data)
     
     # Generate summary statistics
-    summary_stats = generate_summary_statistics(evaluation_data)
+    summary_stats = generate_summary_statistics(evaluation_data, results_frame)
     
     # Export to CSV
-    csv_data = export_to_csv(evaluation_data)
-    
-    # Save all artifacts
-    output_dir = Path("blog_materials/data")
-    output_dir.mkdir(exist_ok=True)
-    
-    # Main dataset
-    with open(output_dir / "comprehensive_evaluation_data.json", "w") as f:
-        json.dump(evaluation_data, f, indent=2)
-    
-    # Summary statistics
-    with open(output_dir / "summary_statistics.json", "w") as f:
-        json.dump(summary_stats, f, indent=2)
-    
-    # CSV export
-    with open(output_dir / "evaluation_results.csv", "w", newline="") as f:
-        if csv_data:
-            writer = csv.DictWriter(f, fieldnames=csv_data[0].keys())
-            writer.writeheader()
-            writer.writerows(csv_data)
+    csv_frame = export_to_csv(results_frame)
     
     # Performance comparison table
     performance_table = []
@@ -361,8 +596,34 @@ def main():
             "Quality Score": f"{sum(stats['avg_quality_ratings'].values())/4:.3f}"
         })
     
-    with open(output_dir / "performance_comparison.json", "w") as f:
-        json.dump(performance_table, f, indent=2)
+    # Save all artifacts
+    output_dir = Path("blog_materials/data")
+    output_dir.mkdir(exist_ok=True)
+    
+    record_lookups = build_record_lookups(evaluation_data["models"], evaluation_data["scenarios"])
+    
+    def write_json(filename, obj, **dumps_kwargs):
+        with open(output_dir / filename, "wb") as f:
+            f.write(orjson.dumps(obj, **dumps_kwargs))
+    
+    # The four files are independent; orjson and pandas do the heavy lifting
+    # in C, so writing them from separate threads overlaps their I/O
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [
+            # Main dataset
+            pool.submit(
+                write_evaluation_data, output_dir / "comprehensive_evaluation_data.json",
+                evaluation_data, record_lookups
+            ),
+            # Summary statistics
+            pool.submit(write_json, "summary_statistics.json", summary_stats, option=JSON_OPTIONS),
+            # CSV export
+            pool.submit(csv_frame.to_csv, output_dir / "evaluation_results.csv", index=False),
+            # Performance comparison table
+            pool.submit(write_json, "performance_comparison.json", performance_table, option=JSON_OPTIONS)
+        ]
+        for future in futures:
+            future.result()
     
     print("✅ Generated evaluation artifacts:")
     print(f"  • Main dataset: {evaluation_data['metadata']['total_conversations']} conversations")
@@ -6,26 +6,101 @@ Real API calls with statistical analysis and cost tracking.
 
 import os
 import asyncio
-import json
 import argparse
+import importlib.util
+import math
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import TYPE_CHECKING, Callable, Dict, List, Any, Optional
 from dotenv import load_dotenv
-from openai import AsyncOpenAI
-from anthropic import AsyncAnthropic
-import numpy as np
-from scipy import stats
+import orjson
+
+from criteria_evaluator import evaluate_response, scenario_checks
+from llm_cache import LLMCache
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# numpy, httpx and the provider SDKs are imported where they are used, so
+# `--help` and argument errors do not pay their import time
 
 # Load environment variables
 load_dotenv()
 
+SYSTEM_PROMPT = "You are a professional customer service agent for an e-commerce store. Be helpful, follow company policies, and provide excellent customer service. Do not offer unauthorized discounts or make promises outside your authority."
+
+# Request parameters shared by both models
+OPENAI_MODEL = "gpt-4o"  # Using GPT-4o as GPT-5 placeholder
+ANTHROPIC_MODEL = "claude-3-5-sonnet-20241022"  # Using Claude-3.5 as Claude Opus 4.1 placeholder
+MAX_TOKENS = 250
+TEMPERATURE = 0.1
+
+# Per-token prices in USD
+GPT5_INPUT_RATE = 5e-6  # GPT-4o: $5/1M input tokens
+GPT5_OUTPUT_RATE = 15e-6  # GPT-4o: $15/1M output tokens
+CLAUDE_INPUT_RATE = 3e-6  # Claude-3.5 Sonnet: $3/1M input tokens
+CLAUDE_OUTPUT_RATE = 15e-6  # Claude-3.5 Sonnet: $15/1M output tokens
+
+# Batch APIs bill at half the real-time price and finish within 24 hours
+BATCH_DISCOUNT = 0.5
+# Batch status polls start quickly for small batches and back off to the cap
+BATCH_POLL_INITIAL_SECONDS = 5
+BATCH_POLL_MAX_SECONDS = 120
+
+# numpy dtype spec of _results_array rows
+RESULTS_DTYPE = [("success", "?"), ("cost", "f8"), ("tokens", "i4")]
+
+def _results_array(rows: List[Dict[str, Any]]) -> "np.ndarray":
+    """Pack evaluated results into a structured array of success, cost and total tokens."""
+    import numpy as np
+    
+    return np.fromiter(
+        (
+            (r.get("overall_success", False), r["cost_usd"], r.get("tokens", {}).get("total", 0))
+            for r in rows
+        ),
+        dtype=RESULTS_DTYPE,
+        count=len(rows)
+    )
+
+def _batch_poll_delays():
+    """Yield the wait before each batch status poll, doubling up to BATCH_POLL_MAX_SECONDS."""
+    delay = BATCH_POLL_INITIAL_SECONDS
+    while True:
+        yield delay
+        delay = min(delay * 2, BATCH_POLL_MAX_SECONDS)
+
+def _wilson_interval(successes: int, total: int, z: float = 1.96) -> tuple:
+    """Wilson score interval for a binomial success proportion."""
+    if total == 0:
+        return 0.0, 1.0
+    p = successes / total
+    denominator = 1 + z * z / total
+    center = (p + z * z / (2 * total)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / denominator
+    return center - half_width, center + half_width
+
+def _two_proportion_ztest(successes_a: int, total_a: int, successes_b: int, total_b: int) -> tuple:
+    """Pooled two-proportion z-test; returns (z, two-sided p-value)."""
+    pooled = (successes_a + successes_b) / (total_a + total_b)
+    se = math.sqrt(pooled * (1 - pooled) * (1 / total_a + 1 / total_b))
+    if se == 0:
+        return 0.0, 1.0  # Identical all-success or all-failure samples
+    z = (successes_a / total_a - successes_b / total_b) / se
+    return z, math.erfc(abs(z) / math.sqrt(2))
+
 class ComparativeBenchmark:
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         self.openai_client = None
         self.anthropic_client = None
         self.results = []
         self.total_cost = 0.0
+        self.cache = LLMCache() if use_cache else None
+        
+        # Cap in-flight requests per provider; each has its own rate limits
+        self._openai_semaphore = asyncio.Semaphore(int(os.getenv("OPENAI_CONCURRENCY", "8")))
+        self._anthropic_semaphore = asyncio.Semaphore(int(os.getenv("ANTHROPIC_CONCURRENCY", "8")))
         
         # Initialize clients
         self._initialize_clients()
@@ -89,45 +164,97 @@ class ComparativeBenchmark:
                 "policy_focus": ["customer_satisfaction", "complaint_procedures"]
             }
         ]
+        
+        # Request payloads and cache keys only depend on the scenario, so build
+        # them once instead of on every trial
+        self._request_payloads = {
+            scenario["id"]: self._build_request_payload(scenario) for scenario in self.scenarios
+        }
+        
+        # Resolve each scenario's criterion checks up front and hand them to
+        # every evaluation, so no call rebuilds the criteria tuple or looks it up
+        self._scenario_checks = {
+            scenario["id"]: scenario_checks(tuple(scenario["success_criteria"])) for scenario in self.scenarios
+        }
+    
+    @staticmethod
+    def _build_request_payload(scenario: Dict[str, Any]) -> Dict[str, Any]:
+        """Precompute per-scenario request messages and cache keys for both models."""
+        user_message = {"role": "user", "content": scenario["task"]}
+        return {
+            "gpt5_messages": [{"role": "system", "content": SYSTEM_PROMPT}, user_message],
+            "gpt5_cache_key": LLMCache.cache_key(OPENAI_MODEL, SYSTEM_PROMPT, scenario["task"], TEMPERATURE, MAX_TOKENS),
+            "claude_messages": [user_message],
+            "claude_cache_key": LLMCache.cache_key(ANTHROPIC_MODEL, SYSTEM_PROMPT, scenario["task"], TEMPERATURE, MAX_TOKENS)
+        }
+    
+    def _request_payload(self, scenario: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the precomputed payload, building it for scenarios added after init."""
+        payload = self._request_payloads.get(scenario["id"])
+        if payload is None:
+            payload = self._request_payloads[scenario["id"]] = self._build_request_payload(scenario)
+        return payload
     
     def _initialize_clients(self):
         """Initialize API clients."""
         openai_key = os.getenv('OPENAI_API_KEY')
         anthropic_key = os.getenv('ANTHROPIC_API_KEY')
         
+        import httpx
+        
+        # OpenAI requests go through one tuned connection pool; HTTP/2
+        # multiplexing is used when the optional h2 package is installed.
+        # The Anthropic SDK only accepts its own httpx2 client, so it keeps
+        # its default pool
+        self._http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=httpx.Timeout(60.0, connect=5.0)
+        )
+        
         if openai_key:
-            self.openai_client = AsyncOpenAI(api_key=openai_key)
+            from openai import AsyncOpenAI
+            self.openai_client = AsyncOpenAI(api_key=openai_key, http_client=self._http_client)
         if anthropic_key:
+            from anthropic import AsyncAnthropic
             self.anthropic_client = AsyncAnthropic(api_key=anthropic_key)
     
-    async def test_gpt5(self, scenario: Dict[str, Any]) -> Dict[str, Any]:
+    async def aclose(self):
+        """Close the HTTP connection pools."""
+        await self._http_client.aclose()
+        if self.anthropic_client:
+            await self.anthropic_client.close()
+    
+    async def test_gpt5(self, scenario: Dict[str, Any], trial: int = 0) -> Dict[str, Any]:
         """Test GPT-5 on a scenario."""
         if not self.openai_client:
             raise ValueError("OpenAI API key not configured")
         
+        payload = self._request_payload(scenario)
+        cache_key = LLMCache.trial_key(payload["gpt5_cache_key"], trial)
+        cached = self._get_cached(cache_key)
+        if cached:
+            return cached
+        
         try:
-            response = await self.openai_client.chat.completions.create(
-                model="gpt-4o",  # Using GPT-4o as GPT-5 placeholder
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "You are a professional customer service agent for an e-commerce store. Be helpful, follow company policies, and provide excellent customer service. Do not offer unauthorized discounts or make promises outside your authority."
-                    },
-                    {"role": "user", "content": scenario["task"]}
-                ],
-                max_tokens=250,
-                temperature=0.1
-            )
+            async with self._openai_semaphore:
+                start_ns = time.time_ns()
+                response = await self.openai_client.chat.completions.create(
+                    model=OPENAI_MODEL,
+                    messages=payload["gpt5_messages"],
+                    max_tokens=MAX_TOKENS,
+                    temperature=TEMPERATURE
+                )
+                end_ns = time.time_ns()
             
             response_text = response.choices[0].message.content
             input_tokens = response.usage.prompt_tokens
             output_tokens = response.usage.completion_tokens
             total_tokens = response.usage.total_tokens
             
-            # GPT-4o pricing: $5/1M input, $15/1M output tokens
-            cost = (input_tokens * 5 + output_tokens * 15) / 1_000_000
+            cost = input_tokens * GPT5_INPUT_RATE + output_tokens * GPT5_OUTPUT_RATE
             
-            return {
+            result = {
                 "model": "gpt5",
                 "scenario_id": scenario["id"],
                 "response": response_text,
@@ -137,43 +264,53 @@ class ComparativeBenchmark:
                     "total": total_tokens
                 },
                 "cost_usd": cost,
-                "timestamp": datetime.now().isoformat()
+                "latency_ms": (end_ns - start_ns) / 1e6,
+                "timestamp_ns": end_ns
             }
+            if self.cache:
+                self.cache.set(cache_key, result)
+            return result
             
         except Exception as e:
             return {
                 "model": "gpt5",
                 "scenario_id": scenario["id"],
                 "error": str(e),
-                "cost_usd": 0,
-                "timestamp": datetime.now().isoformat()
+                "cost_usd": 0.0,
+                "timestamp_ns": time.time_ns()
             }
     
-    async def test_claude_opus_4_1(self, scenario: Dict[str, Any]) -> Dict[str, Any]:
+    async def test_claude_opus_4_1(self, scenario: Dict[str, Any], trial: int = 0) -> Dict[str, Any]:
         """Test Claude Opus 4.1 on a scenario."""
         if not self.anthropic_client:
             raise ValueError("Anthropic API key not configured")
         
+        payload = self._request_payload(scenario)
+        cache_key = LLMCache.trial_key(payload["claude_cache_key"], trial)
+        cached = self._get_cached(cache_key)
+        if cached:
+            return cached
+        
         try:
-            response = await self.anthropic_client.messages.create(
-                model="claude-3-5-sonnet-20241022",  # Using Claude-3.5 as Claude Opus 4.1 placeholder
-                max_tokens=250,
-                temperature=0.1,
-                system="You are a professional customer service agent for an e-commerce store. Be helpful, follow company policies, and provide excellent customer service. Do not offer unauthorized discounts or make promises outside your authority.",
-                messages=[
-                    {"role": "user", "content": scenario["task"]}
-                ]
-            )
+            async with self._anthropic_semaphore:
+                start_ns = time.time_ns()
+                response = await self.anthropic_client.messages.create(
+                    model=ANTHROPIC_MODEL,
+                    max_tokens=MAX_TOKENS,
+                    temperature=TEMPERATURE,
+                    system=SYSTEM_PROMPT,
+                    messages=payload["claude_messages"]
+                )
+                end_ns = time.time_ns()
             
             response_text = response.content[0].text
             input_tokens = response.usage.input_tokens
             output_tokens = response.usage.output_tokens
             total_tokens = input_tokens + output_tokens
             
-            # Claude-3.5 Sonnet pricing: $3/1M input, $15/1M output tokens
-            cost = (input_tokens * 3 + output_tokens * 15) / 1_000_000
+            cost = input_tokens * CLAUDE_INPUT_RATE + output_tokens * CLAUDE_OUTPUT_RATE
             
-            return {
+            result = {
                 "model": "claude_opus_4_1",
                 "scenario_id": scenario["id"],
                 "response": response_text,
@@ -183,90 +320,327 @@ class ComparativeBenchmark:
                     "total": total_tokens
                 },
                 "cost_usd": cost,
-                "timestamp": datetime.now().isoformat()
+                "latency_ms": (end_ns - start_ns) / 1e6,
+                "timestamp_ns": end_ns
             }
+            if self.cache:
+                self.cache.set(cache_key, result)
+            return result
             
         except Exception as e:
             return {
                 "model": "claude_opus_4_1", 
                 "scenario_id": scenario["id"],
                 "error": str(e),
-                "cost_usd": 0,
-                "timestamp": datetime.now().isoformat()
+                "cost_usd": 0.0,
+                "timestamp_ns": time.time_ns()
             }
     
-    def evaluate_response(self, scenario: Dict[str, Any], response: str) -> Dict[str, Any]:
-        """Evaluate response quality against success criteria."""
-        response_lower = response.lower()
-        
-        success_count = 0
-        total_criteria = len(scenario["success_criteria"])
-        evaluation_details = {}
+    def _get_cached(self, cache_key: bytes) -> Optional[Dict[str, Any]]:
+        """Return a cached result marked as free, or None on a cache miss.
+        
+        The stored latency belongs to the original request, so it is dropped
+        rather than reported as if it had been measured again.
+        """
+        if not self.cache:
+            return None
+        
+        result = self.cache.get(cache_key)
+        if result:
+            result.pop("latency_ms", None)
+            result.update({
+                "cost_usd": 0.0,
+                "cached": True,
+                "timestamp_ns": time.time_ns()
+            })
+        return result
+    
+    async def _run_batches(self, requests: List[tuple]) -> List[tuple]:
+        """Run (scenario_idx, scenario, trial) requests through both providers' batch APIs.
+        
+        Returns (scenario_idx, scenario, trial, gpt5_result, claude_result) tuples
+        in request order, the same shape _run_trial produces.
+        """
+        gpt5_results, claude_results = await asyncio.gather(
+            self._run_openai_batch(requests),
+            self._run_anthropic_batch(requests)
+        )
+        return [
+            (scenario_idx, scenario, trial, gpt5_result, claude_result)
+            for (scenario_idx, scenario, trial), gpt5_result, claude_result
+            in zip(requests, gpt5_results, claude_results)
+        ]
+    
+    def _batch_result(self, model: str, scenario: Dict[str, Any], response_text: str,
+                      input_tokens: int, output_tokens: int, cost: float) -> Dict[str, Any]:
+        """Build a result dict for a batch response, in the same shape as a real-time one."""
+        return {
+            "model": model,
+            "scenario_id": scenario["id"],
+            "response": response_text,
+            "tokens": {
+                "input": input_tokens,
+                "output": output_tokens,
+                "total": input_tokens + output_tokens
+            },
+            "cost_usd": cost,
+            "batch": True,
+            "timestamp_ns": time.time_ns()
+        }
+    
+    def _batch_error(self, model: str, scenario: Dict[str, Any], error: str) -> Dict[str, Any]:
+        return {
+            "model": model,
+            "scenario_id": scenario["id"],
+            "error": error,
+            "cost_usd": 0.0,
+            "timestamp_ns": time.time_ns()
+        }
+    
+    async def _run_openai_batch(self, requests: List[tuple]) -> List[Dict[str, Any]]:
+        """Submit uncached GPT-5 requests as one OpenAI batch and wait for its results."""
+        if not self.openai_client:
+            raise ValueError("OpenAI API key not configured")
         
-        for criterion in scenario["success_criteria"]:
-            passed = False
-            
-            if criterion == "offers_to_search":
-                passed = any(word in response_lower for word in ["search", "look", "find", "browse", "options"])
-            elif criterion == "asks_clarifying_questions":
-                passed = "?" in response and any(word in response_lower for word in ["what", "which", "how", "when", "prefer"])
-            elif criterion == "professional_tone":
-                passed = any(word in response_lower for word in ["happy", "help", "assist", "please", "thank"])
-            elif criterion == "offers_to_check_status":
-                passed = any(word in response_lower for word in ["check", "look up", "status", "investigate"])
-            elif criterion == "provides_timeline":
-                passed = any(word in response_lower for word in ["day", "time", "soon", "shortly", "within"])
-            elif criterion == "professional_service":
-                passed = any(word in response_lower for word in ["help", "assist", "service", "support"])
-            elif criterion == "explains_policy_clearly":
-                passed = any(word in response_lower for word in ["policy", "return", "days", "condition"])
-            elif criterion == "addresses_timeframe":
-                passed = any(word in response_lower for word in ["3 weeks", "21 days", "timeframe", "period"])
-            elif criterion == "helpful_guidance":
-                passed = any(word in response_lower for word in ["help", "guide", "assist", "process"])
-            elif criterion == "polite_decline":
-                passed = any(word in response_lower for word in ["unfortunately", "unable", "cannot", "policy"])
-            elif criterion == "offers_alternatives":
-                passed = any(word in response_lower for word in ["alternative", "instead", "other", "different", "sale"])
-            elif criterion == "maintains_policy":
-                passed = "20%" not in response or "discount" not in response_lower
-            elif criterion == "systematic_troubleshooting":
-                passed = any(word in response_lower for word in ["try", "step", "check", "troubleshoot"])
-            elif criterion == "escalation_offer":
-                passed = any(word in response_lower for word in ["technical", "specialist", "escalate", "manager"])
-            elif criterion == "empathetic_response":
-                passed = any(word in response_lower for word in ["understand", "sorry", "frustrated", "apologize"])
-            elif criterion == "identifies_business_need":
-                passed = any(word in response_lower for word in ["business", "company", "bulk", "50"])
-            elif criterion == "mentions_bulk_options":
-                passed = any(word in response_lower for word in ["bulk", "business", "volume", "pricing"])
-            elif criterion == "appropriate_escalation":
-                passed = any(word in response_lower for word in ["business", "sales", "specialist", "team"])
-            elif criterion == "acknowledges_frustration":
-                passed = any(word in response_lower for word in ["understand", "sorry", "apologize", "frustrated"])
-            elif criterion == "offers_solution":
-                passed = any(word in response_lower for word in ["refund", "solution", "resolve", "help"])
-            elif criterion == "de_escalation":
-                passed = any(word in response_lower for word in ["understand", "work", "resolve", "make right"])
+        results = {}
+        pending = {}
+        for scenario_idx, scenario, trial in requests:
+            custom_id = f"gpt5-{scenario['id']}-{trial}"
+            payload = self._request_payload(scenario)
+            cache_key = LLMCache.trial_key(payload["gpt5_cache_key"], trial)
+            cached = self._get_cached(cache_key)
+            if cached:
+                results[custom_id] = cached
             else:
-                passed = True  # Default for unknown criteria
+                pending[custom_id] = (scenario, cache_key, payload)
+        
+        if pending:
+            batch_input = b"".join(
+                orjson.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": OPENAI_MODEL,
+                        "messages": payload["gpt5_messages"],
+                        "max_tokens": MAX_TOKENS,
+                        "temperature": TEMPERATURE
+                    }
+                }) + b"\n"
+                for custom_id, (scenario, _, payload) in pending.items()
+            )
             
-            evaluation_details[criterion] = passed
-            if passed:
-                success_count += 1
+            try:
+                batch_file = await self.openai_client.files.create(
+                    file=("gpt5_batch.jsonl", batch_input), purpose="batch"
+                )
+                batch = await self.openai_client.batches.create(
+                    input_file_id=batch_file.id,
+                    endpoint="/v1/chat/completions",
+                    completion_window="24h"
+                )
+                print(f"   📦 OpenAI batch {batch.id} submitted ({len(pending)} requests)")
+                poll_delays = _batch_poll_delays()
+                while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                    await asyncio.sleep(next(poll_delays))
+                    batch = await self.openai_client.batches.retrieve(batch.id)
+                
+                output_lines = []
+                if batch.output_file_id:
+                    output = await self.openai_client.files.content(batch.output_file_id)
+                    output_lines = output.text.splitlines()
+                
+                for line in output_lines:
+                    entry = orjson.loads(line)
+                    scenario, cache_key, _ = pending[entry["custom_id"]]
+                    response = entry.get("response") or {}
+                    body = response.get("body") or {}
+                    if response.get("status_code") != 200:
+                        results[entry["custom_id"]] = self._batch_error(
+                            "gpt5", scenario, str(entry.get("error") or body.get("error"))
+                        )
+                        continue
+                    
+                    usage = body["usage"]
+                    input_tokens = usage["prompt_tokens"]
+                    output_tokens = usage["completion_tokens"]
+                    
+                    cost = (input_tokens * GPT5_INPUT_RATE + output_tokens * GPT5_OUTPUT_RATE) * BATCH_DISCOUNT
+                    
+                    result = self._batch_result(
+                        "gpt5", scenario, body["choices"][0]["message"]["content"],
+                        input_tokens, output_tokens, cost
+                    )
+                    if self.cache:
+                        self.cache.set(cache_key, result)
+                    results[entry["custom_id"]] = result
+                
+                batch_error = f"Batch {batch.id} {batch.status} without a result for this request"
+            except Exception as e:
+                batch_error = str(e)
+            
+            for custom_id, (scenario, _, _) in pending.items():
+                if custom_id not in results:
+                    results[custom_id] = self._batch_error("gpt5", scenario, batch_error)
         
-        success_rate = success_count / total_criteria if total_criteria > 0 else 0
+        return [results[f"gpt5-{scenario['id']}-{trial}"] for _, scenario, trial in requests]
+    
+    async def _run_anthropic_batch(self, requests: List[tuple]) -> List[Dict[str, Any]]:
+        """Submit uncached Claude requests as one Anthropic message batch and wait for its results."""
+        if not self.anthropic_client:
+            raise ValueError("Anthropic API key not configured")
         
-        return {
-            "success_rate": success_rate,
-            "criteria_met": success_count,
-            "total_criteria": total_criteria,
-            "details": evaluation_details,
-            "overall_success": success_rate >= 0.7  # 70% threshold for success
-        }
+        results = {}
+        pending = {}
+        for scenario_idx, scenario, trial in requests:
+            custom_id = f"claude-{scenario['id']}-{trial}"
+            payload = self._request_payload(scenario)
+            cache_key = LLMCache.trial_key(payload["claude_cache_key"], trial)
+            cached = self._get_cached(cache_key)
+            if cached:
+                results[custom_id] = cached
+            else:
+                pending[custom_id] = (scenario, cache_key, payload)
+        
+        if pending:
+            try:
+                batch = await self.anthropic_client.messages.batches.create(
+                    requests=[
+                        {
+                            "custom_id": custom_id,
+                            "params": {
+                                "model": ANTHROPIC_MODEL,
+                                "max_tokens": MAX_TOKENS,
+                                "temperature": TEMPERATURE,
+                                "system": SYSTEM_PROMPT,
+                                "messages": payload["claude_messages"]
+                            }
+                        }
+                        for custom_id, (scenario, _, payload) in pending.items()
+                    ]
+                )
+                print(f"   📦 Anthropic batch {batch.id} submitted ({len(pending)} requests)")
+                poll_delays = _batch_poll_delays()
+                while batch.processing_status != "ended":
+                    await asyncio.sleep(next(poll_delays))
+                    batch = await self.anthropic_client.messages.batches.retrieve(batch.id)
+                
+                async for entry in await self.anthropic_client.messages.batches.results(batch.id):
+                    scenario, cache_key, _ = pending[entry.custom_id]
+                    if entry.result.type != "succeeded":
+                        error = getattr(entry.result, "error", None) or entry.result.type
+                        results[entry.custom_id] = self._batch_error("claude_opus_4_1", scenario, str(error))
+                        continue
+                    
+                    message = entry.result.message
+                    input_tokens = message.usage.input_tokens
+                    output_tokens = message.usage.output_tokens
+                    
+                    cost = (input_tokens * CLAUDE_INPUT_RATE + output_tokens * CLAUDE_OUTPUT_RATE) * BATCH_DISCOUNT
+                    
+                    result = self._batch_result(
+                        "claude_opus_4_1", scenario, message.content[0].text,
+                        input_tokens, output_tokens, cost
+                    )
+                    if self.cache:
+                        self.cache.set(cache_key, result)
+                    results[entry.custom_id] = result
+                
+                batch_error = f"Batch {batch.id} ended without a result for this request"
+            except Exception as e:
+                batch_error = str(e)
+            
+            for custom_id, (scenario, _, _) in pending.items():
+                if custom_id not in results:
+                    results[custom_id] = self._batch_error("claude_opus_4_1", scenario, batch_error)
+        
+        return [results[f"claude-{scenario['id']}-{trial}"] for _, scenario, trial in requests]
+    
+    async def _run_trial(self, scenario_idx: int, scenario: Dict[str, Any], trial: int):
+        """Query both models concurrently for one trial of a scenario."""
+        gpt5_result, claude_result = await asyncio.gather(
+            self.test_gpt5(scenario, trial),
+            self.test_claude_opus_4_1(scenario, trial)
+        )
+        return scenario_idx, scenario, trial, gpt5_result, claude_result
+    
+    def evaluate_response(self, scenario: Dict[str, Any], response: str) -> Dict[str, Any]:
+        """Evaluate response quality against success criteria."""
+        return evaluate_response(scenario, response, self._scenario_checks.get(scenario.get("id")))
+    
+    async def _run_scenario_with_early_stop(self, scenario_idx: int, scenario: Dict[str, Any],
+                                            trials_per_scenario: int, min_trials: int,
+                                            record: Callable):
+        """Run one scenario's trials in order, stopping once a winner is already clear.
+        
+        After at least min_trials trials, the scenario stops as soon as the 95%
+        Wilson intervals of the two models' success rates no longer overlap.
+        """
+        gpt5_successes = claude_successes = 0
+        
+        for trial in range(trials_per_scenario):
+            _, _, _, gpt5_result, claude_result = await self._run_trial(scenario_idx, scenario, trial)
+            record(scenario_idx, scenario, trial, gpt5_result, claude_result)
+            
+            gpt5_successes += bool(gpt5_result.get("overall_success", False))
+            claude_successes += bool(claude_result.get("overall_success", False))
+            completed = trial + 1
+            
+            if completed < min_trials or completed == trials_per_scenario:
+                continue
+            
+            gpt5_lower, gpt5_upper = _wilson_interval(gpt5_successes, completed)
+            claude_lower, claude_upper = _wilson_interval(claude_successes, completed)
+            if gpt5_lower > claude_upper or claude_lower > gpt5_upper:
+                print(f"   ⏹️  Scenario {scenario_idx} ({scenario['name']}): "
+                      f"stopped early at trial {completed}/{trials_per_scenario}")
+                return
     
-    async def run_comparative_benchmark(self, num_scenarios: int = 7, trials_per_scenario: int = 1):
-        """Run comparative benchmark between GPT-5 and Claude Opus 4.1."""
+    def _record_trial(self, results_file, trial_results: Dict, trials_per_scenario: int,
+                      scenario_idx: int, scenario: Dict[str, Any], trial: int,
+                      gpt5_result: Dict[str, Any], claude_result: Dict[str, Any]):
+        """Evaluate, stream, tally and print one completed trial."""
+        # Evaluate responses
+        if "response" in gpt5_result:
+            gpt5_evaluation = self.evaluate_response(scenario, gpt5_result["response"])
+            gpt5_result.update(gpt5_evaluation)
+            
+        if "response" in claude_result:
+            claude_evaluation = self.evaluate_response(scenario, claude_result["response"])
+            claude_result.update(claude_evaluation)
+        
+        trial_results[(scenario_idx, trial)] = [gpt5_result, claude_result]
+        for result in (gpt5_result, claude_result):
+            result["trial"] = trial
+            results_file.write(orjson.dumps(result, default=str) + b"\n")
+        results_file.flush()
+        
+        # Update total cost
+        self.total_cost += gpt5_result["cost_usd"]
+        self.total_cost += claude_result["cost_usd"]
+        
+        # Show trial results as they complete
+        gpt5_success = gpt5_result.get("overall_success", False)
+        claude_success = claude_result.get("overall_success", False)
+        
+        trial_label = f", trial {trial + 1}/{trials_per_scenario}" if trials_per_scenario > 1 else ""
+        print(f"   Scenario {scenario_idx} ({scenario['name']}{trial_label}):")
+        print(f"      GPT-5: {'✅' if gpt5_success else '❌'} "
+              f"({gpt5_result.get('success_rate', 0):.1%} criteria met, "
+              f"${gpt5_result['cost_usd']:.4f})")
+        print(f"      Claude: {'✅' if claude_success else '❌'} "
+              f"({claude_result.get('success_rate', 0):.1%} criteria met, "
+              f"${claude_result['cost_usd']:.4f})")
+    
+    async def run_comparative_benchmark(self, num_scenarios: int = 7, trials_per_scenario: int = 1,
+                                        early_stop_after: Optional[int] = None, use_batch: bool = False):
+        """Run comparative benchmark between GPT-5 and Claude Opus 4.1.
+        
+        If early_stop_after is set, each scenario's trials run sequentially and
+        stop early once one model's lead is statistically clear after at least
+        that many trials. If use_batch is set, all requests go through the
+        providers' batch APIs at half price instead (early stopping does not apply).
+        """
         
         print("🏁 GPT-5 vs Claude Opus 4.1 Comparative Benchmark")
         print("=" * 60)
@@ -274,53 +648,67 @@ class ComparativeBenchmark:
         print()
         
         selected_scenarios = self.scenarios[:num_scenarios]
-        all_results = []
         
         for scenario_idx, scenario in enumerate(selected_scenarios, 1):
             print(f"📋 Scenario {scenario_idx}: {scenario['name']} ({scenario['complexity']})")
             print(f"   Task: {scenario['task'][:70]}...")
+        print()
+        
+        trial_results = {}
+        
+        # Results are appended to a JSON Lines file as each trial completes, so
+        # a crash mid-run keeps everything finished so far
+        results_dir = Path("results")
+        results_dir.mkdir(exist_ok=True)
+        benchmark_id = f"gpt5_vs_claude_opus_4_1_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        results_path = results_dir / f"{benchmark_id}.jsonl"
+        
+        with open(results_path, "ab") as results_file:
+            def record(scenario_idx, scenario, trial, gpt5_result, claude_result):
+                self._record_trial(
+                    results_file, trial_results, trials_per_scenario,
+                    scenario_idx, scenario, trial, gpt5_result, claude_result
+                )
             
-            for trial in range(trials_per_scenario):
-                if trials_per_scenario > 1:
-                    print(f"   Trial {trial + 1}/{trials_per_scenario}")
-                
-                # Test both models
-                gpt5_result = await self.test_gpt5(scenario)
-                claude_result = await self.test_claude_opus_4_1(scenario)
-                
-                # Evaluate responses
-                if "response" in gpt5_result:
-                    gpt5_evaluation = self.evaluate_response(scenario, gpt5_result["response"])
-                    gpt5_result.update(gpt5_evaluation)
-                    
-                if "response" in claude_result:
-                    claude_evaluation = self.evaluate_response(scenario, claude_result["response"])
-                    claude_result.update(claude_evaluation)
-                
-                all_results.extend([gpt5_result, claude_result])
-                
-                # Update total cost
-                self.total_cost += gpt5_result.get("cost_usd", 0)
-                self.total_cost += claude_result.get("cost_usd", 0)
-                
-                # Show trial results
-                gpt5_success = gpt5_result.get("overall_success", False)
-                claude_success = claude_result.get("overall_success", False)
-                
-                print(f"      GPT-5: {'✅' if gpt5_success else '❌'} "
-                      f"({gpt5_result.get('success_rate', 0):.1%} criteria met, "
-                      f"${gpt5_result.get('cost_usd', 0):.4f})")
-                print(f"      Claude: {'✅' if claude_success else '❌'} "
-                      f"({claude_result.get('success_rate', 0):.1%} criteria met, "
-                      f"${claude_result.get('cost_usd', 0):.4f})")
-            
-            print()
+            if use_batch:
+                # Batch results arrive all at once, after the provider finishes the batch
+                requests = [
+                    (scenario_idx, scenario, trial)
+                    for scenario_idx, scenario in enumerate(selected_scenarios, 1)
+                    for trial in range(trials_per_scenario)
+                ]
+                for trial_result in await self._run_batches(requests):
+                    record(*trial_result)
+            elif early_stop_after:
+                # Trials run in order within each scenario so the running tallies
+                # can end a scenario early; scenarios still run concurrently
+                await asyncio.gather(*(
+                    self._run_scenario_with_early_stop(
+                        scenario_idx, scenario, trials_per_scenario, early_stop_after, record
+                    )
+                    for scenario_idx, scenario in enumerate(selected_scenarios, 1)
+                ))
+            else:
+                # Every scenario/trial pair is independent, so issue them all at once;
+                # within a trial both models are queried concurrently as well
+                tasks = [
+                    asyncio.create_task(self._run_trial(scenario_idx, scenario, trial))
+                    for scenario_idx, scenario in enumerate(selected_scenarios, 1)
+                    for trial in range(trials_per_scenario)
+                ]
+                for next_completed in asyncio.as_completed(tasks):
+                    record(*await next_completed)
+        
+        print()
+        
+        # Keep results in scenario/trial order regardless of completion order
+        all_results = [result for key in sorted(trial_results) for result in trial_results[key]]
         
         # Calculate comparative statistics
         self._generate_comparative_analysis(all_results, selected_scenarios)
         
-        # Save results
-        self._save_results(all_results, selected_scenarios)
+        # Save run manifest
+        self._save_results(all_results, selected_scenarios, benchmark_id, results_path)
         
         return all_results
     
@@ -334,27 +722,29 @@ class ComparativeBenchmark:
             print("⚠️  Insufficient results for statistical analysis")
             return
         
+        # One pass per model into a structured array; all stats derive from it
+        gpt5_array = _results_array(gpt5_results)
+        claude_array = _results_array(claude_results)
+        
         # Calculate success rates
-        gpt5_successes = sum(1 for r in gpt5_results if r["overall_success"])
-        claude_successes = sum(1 for r in claude_results if r["overall_success"])
+        gpt5_successes = int(gpt5_array["success"].sum())
+        claude_successes = int(claude_array["success"].sum())
         
-        gpt5_success_rate = gpt5_successes / len(gpt5_results)
-        claude_success_rate = claude_successes / len(claude_results)
+        gpt5_success_rate = gpt5_successes / len(gpt5_array)
+        claude_success_rate = claude_successes / len(claude_array)
         
         # Calculate costs
-        gpt5_cost = sum(r.get("cost_usd", 0) for r in gpt5_results)
-        claude_cost = sum(r.get("cost_usd", 0) for r in claude_results)
+        gpt5_cost = float(gpt5_array["cost"].sum())
+        claude_cost = float(claude_array["cost"].sum())
         
         # Calculate average tokens
-        gpt5_avg_tokens = np.mean([r.get("tokens", {}).get("total", 0) for r in gpt5_results if "tokens" in r])
-        claude_avg_tokens = np.mean([r.get("tokens", {}).get("total", 0) for r in claude_results if "tokens" in r])
-        
-        # Statistical significance test
-        gpt5_success_array = [1 if r["overall_success"] else 0 for r in gpt5_results]
-        claude_success_array = [1 if r["overall_success"] else 0 for r in claude_results]
+        gpt5_avg_tokens = gpt5_array["tokens"].mean()
+        claude_avg_tokens = claude_array["tokens"].mean()
         
-        # Two-sample t-test
-        t_stat, p_value = stats.ttest_ind(gpt5_success_array, claude_success_array)
+        # Two-proportion z-test on success counts
+        z_stat, p_value = _two_proportion_ztest(
+            gpt5_successes, len(gpt5_array), claude_successes, len(claude_array)
+        )
         
         print("📊 **COMPARATIVE ANALYSIS RESULTS**")
         print("=" * 50)
@@ -423,33 +813,35 @@ class ComparativeBenchmark:
         else:
             print(f"   • Claude Opus 4.1 more cost-efficient: ${claude_cost_per_success:.4f} per successful task")
     
-    def _save_results(self, results: List[Dict], scenarios: List[Dict]):
-        """Save benchmark results to file."""
-        results_dir = Path("results")
-        results_dir.mkdir(exist_ok=True)
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"gpt5_vs_claude_opus_4_1_{timestamp}.json"
-        filepath = results_dir / filename
+    def _save_results(self, results: List[Dict], scenarios: List[Dict], benchmark_id: str, results_path: Path):
+        """Save the run manifest next to the streamed JSON Lines results."""
+        filepath = results_path.with_suffix(".json")
         
         benchmark_data = {
-            "benchmark_id": f"gpt5_vs_claude_opus_4_1_{timestamp}",
+            "benchmark_id": benchmark_id,
             "timestamp": datetime.now().isoformat(),
             "models": ["gpt5", "claude_opus_4_1"],
             "total_scenarios": len(scenarios),
             "total_cost_usd": self.total_cost,
             "scenarios": scenarios,
-            "results": results,
+            "results_file": results_path.name,
             "summary": self._calculate_summary_stats(results)
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(benchmark_data, f, indent=2, default=str)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(
+                benchmark_data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ))
         
-        print(f"💾 **Results saved to:** {filepath}")
+        print(f"💾 **Results saved to:** {results_path}")
+        print(f"💾 **Manifest saved to:** {filepath}")
     
     def _calculate_summary_stats(self, results: List[Dict]) -> Dict[str, Any]:
         """Calculate summary statistics."""
+        import numpy as np
+        
         gpt5_results = [r for r in results if r["model"] == "gpt5" and "overall_success" in r]
         claude_results = [r for r in results if r["model"] == "claude_opus_4_1" and "overall_success" in r]
         
@@ -458,14 +850,14 @@ class ComparativeBenchmark:
                 "total_tests": len(gpt5_results),
                 "successes": sum(1 for r in gpt5_results if r["overall_success"]),
                 "success_rate": sum(1 for r in gpt5_results if r["overall_success"]) / len(gpt5_results) if gpt5_results else 0,
-                "total_cost": sum(r.get("cost_usd", 0) for r in gpt5_results),
+                "total_cost": sum(r["cost_usd"] for r in gpt5_results),
                 "avg_tokens": np.mean([r.get("tokens", {}).get("total", 0) for r in gpt5_results if "tokens" in r])
             },
             "claude_opus_4_1": {
                 "total_tests": len(claude_results),
                 "successes": sum(1 for r in claude_results if r["overall_success"]),
                 "success_rate": sum(1 for r in claude_results if r["overall_success"]) / len(claude_results) if claude_results else 0,
-                "total_cost": sum(r.get("cost_usd", 0) for r in claude_results),
+                "total_cost": sum(r["cost_usd"] for r in claude_results),
                 "avg_tokens": np.mean([r.get("tokens", {}).get("total", 0) for r in claude_results if "tokens" in r])
             }
         }
@@ -479,19 +871,40 @@ async def main():
                        help="Number of scenarios to test (1-7)")
     parser.add_argument("--trials", type=int, default=1,
                        help="Number of trials per scenario")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Always call the APIs instead of reusing cached responses")
+    parser.add_argument("--early-stop-after", type=int, default=None, metavar="N",
+                       help="Stop a scenario's trials once the winner is clear after at least N trials")
+    parser.add_argument("--batch", action="store_true",
+                       help="Submit requests through the OpenAI/Anthropic batch APIs (50%% cheaper, up to 24h)")
     
     args = parser.parse_args()
     
+    benchmark = None
     try:
-        benchmark = ComparativeBenchmark()
+        benchmark = ComparativeBenchmark(use_cache=not args.no_cache)
         await benchmark.run_comparative_benchmark(
             num_scenarios=args.scenarios,
-            trials_per_scenario=args.trials
+            trials_per_scenario=args.trials,
+            early_stop_after=args.early_stop_after,
+            use_batch=args.batch
         )
     except KeyboardInterrupt:
         print("\n⚠️  Benchmark interrupted by user")
     except Exception as e:
         print(f"❌ Benchmark error: {e}")
+    finally:
+        if benchmark:
+            await benchmark.aclose()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Use the libuv-based event loop when the optional uvloop package is installed
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    
+    if uvloop:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
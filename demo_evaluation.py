@@ -1,120 +1,211 @@
 #!/usr/bin/env python3
 """Demo evaluation showing GPT-5 vs Claude Opus 4.1 comparison results."""
 
+import itertools
 import json
-import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 from src.evaluation.results import EvaluationResult, EvaluationReport
-from src.evaluation.metrics import PassKMetric, SuccessRateMetric, PolicyComplianceMetric, ResponseQualityMetric
-from src.domains.retail.scenarios import get_retail_scenarios
+from src.evaluation.metrics import (
+    QUALITY_DIMENSIONS, PassKMetric, SuccessRateMetric, PolicyComplianceMetric, ResponseQualityMetric, evaluate_all
+)
+from src.domains.retail.scenarios import RetailScenario, get_retail_scenarios
 
 
-def generate_mock_conversation(scenario_id: str, model_name: str, trial_id: int, success_rate: float) -> dict:
-    """Generate a realistic mock conversation result."""
-    
-    scenarios_manager = get_retail_scenarios()
-    scenario = scenarios_manager.get_scenario(scenario_id)
+# Characteristics for different models to simulate realistic behavior
+_MODEL_CHARS = MappingProxyType({
+    "gpt5": {
+        "success_rate": 0.92,  # Very high success rate
+        "tool_usage_accuracy": 0.95,  # Excellent tool usage
+        "policy_compliance": 0.88,  # Good compliance
+        "response_quality": {
+            "relevance": 0.93,
+            "completeness": 0.91, 
+            "clarity": 0.94,
+            "helpfulness": 0.92
+        },
+        "common_violations": ["purchase_pressure"],  # Occasional sales pressure
+        "violation_rate": 0.12
+    },
+    "claude_opus_4_1": {
+        "success_rate": 0.89,  # High success rate
+        "tool_usage_accuracy": 0.97,  # Excellent tool usage
+        "policy_compliance": 0.95,  # Excellent compliance
+        "response_quality": {
+            "relevance": 0.91,
+            "completeness": 0.93,
+            "clarity": 0.96,
+            "helpfulness": 0.94
+        },
+        "common_violations": ["inventory_misrepresentation"],  # Rare violations
+        "violation_rate": 0.05
+    }
+})
+
+# The scenario catalogue is static, so it is loaded once at import
+_SCENARIOS = get_retail_scenarios()
+
+
+def draw_model_trials(rng: np.random.Generator, characteristics: dict, n: int, max_tools: int) -> Dict[str, np.ndarray]:
+    """Draw the random inputs for n mock trials of one model in batched NumPy calls.
+    
+    Row i of every array belongs to trial i, in (scenario, trial) order.
+    """
+    common_violations = characteristics.get("common_violations", ["pricing_error"])
+    base_quality = np.array([characteristics["response_quality"][dim] for dim in QUALITY_DIMENSIONS])
+    
+    # Violation types and severities are only drawn for the trials that have
+    # one; the other rows stay zero and are never read
+    violation = rng.random(n) < characteristics["violation_rate"]
+    n_violations = int(np.count_nonzero(violation))
+    violation_type = np.zeros(n, dtype=np.int64)
+    violation_type[violation] = rng.integers(0, len(common_violations), n_violations)
+    violation_severity = np.zeros(n)
+    violation_severity[violation] = rng.uniform(0.3, 0.8, n_violations)
     
-    # Determine success based on model's success rate
-    success = random.random() < success_rate
+    return {
+        # Determine success based on model's success rate
+        "success": rng.random(n) < characteristics["success_rate"],
+        # Mock conversation turns (2-6 turns)
+        "turns": rng.integers(2, 7, n),
+        "duration": rng.uniform(15.0, 45.0, n),  # 15-45 seconds
+        # Whether each expected tool is used, based on accuracy
+        "tool_used": rng.random((n, max_tools)) < characteristics["tool_usage_accuracy"],
+        "violation": violation,
+        "violation_type": violation_type,
+        "violation_severity": violation_severity,
+        # Quality ratings with some random variance (±0.1), clipped to [0, 1]
+        "quality": np.clip(base_quality + rng.uniform(-0.1, 0.1, (n, len(base_quality))), 0.0, 1.0)
+    }
+
+
+@dataclass(slots=True)
+class ResultBatch:
+    """Mock results stored as columns; row i is one (model, scenario, trial) conversation.
+    
+    ``columns`` holds the draw_model_trials arrays for all rows plus the
+    ``model_id``, ``scenario_idx`` and ``trial_id`` index columns. Result
+    dicts are only built when the batch is iterated.
+    """
+    models: List[str]
+    scenario_ids: List[str]
+    scenarios: List[RetailScenario]
+    columns: Dict[str, np.ndarray]
+    timestamp: str
+    
+    def __len__(self) -> int:
+        return len(self.columns["success"])
+    
+    def __iter__(self) -> Iterator[dict]:
+        columns = self.columns
+        rows = zip(columns["model_id"].tolist(), columns["scenario_idx"].tolist(), columns["trial_id"].tolist())
+        gens = [make_gen(model) for model in self.models]
+        criteria_met = [success_criteria_variants(scenario) for scenario in self.scenarios]
+        for i, (model_id, scenario_idx, trial_id) in enumerate(rows):
+            yield gens[model_id](
+                self.scenario_ids[scenario_idx], self.scenarios[scenario_idx],
+                trial_id, columns, i, self.timestamp, criteria_met[scenario_idx]
+            )
+
+
+def make_gen(model_name: str):
+    """Build a result builder for one model with its characteristics bound up front."""
     
-    # Generate realistic metrics based on model characteristics
     model_characteristics = get_model_characteristics(model_name)
     
-    # Mock conversation turns (2-6 turns)
-    turns = random.randint(2, 6)
-    
-    # Mock tools used based on scenario
-    tools_used = generate_mock_tools_used(scenario.expected_tools, model_characteristics)
-    
-    # Mock policy violations based on model
-    violations = generate_mock_violations(model_characteristics, scenario.policy_focus)
-    
-    # Mock quality ratings
-    quality = generate_mock_quality_ratings(model_characteristics)
-    
-    duration = random.uniform(15.0, 45.0)  # 15-45 seconds
+    def gen(scenario_id: str, scenario: RetailScenario, trial_id: int,
+            draws: Dict[str, np.ndarray], i: int, now_iso: str, criteria_met: Tuple[dict, dict]) -> dict:
+        success = bool(draws["success"][i])
+        turns = int(draws["turns"][i])
+        
+        # Mock tools used based on scenario
+        tools_used = generate_mock_tools_used(scenario.expected_tools, draws["tool_used"][i])
+        
+        # Mock policy violations based on model
+        violations = generate_mock_violations(
+            model_characteristics, True,
+            int(draws["violation_type"][i]), float(draws["violation_severity"][i])
+        ) if draws["violation"][i] else []
+        
+        # Mock quality ratings
+        quality = generate_mock_quality_ratings(draws["quality"][i])
+        
+        return {
+            "task_id": f"{scenario_id}_{trial_id}",
+            "model_name": model_name,
+            "scenario_id": scenario_id,
+            "trial_id": trial_id,
+            "success": success,
+            "completion_reason": "success_criteria_met" if success else "insufficient_criteria",
+            "conversation_turns": turns,
+            "tools_used": tools_used,
+            "policy_violations": violations,
+            "duration_seconds": float(draws["duration"][i]),
+            "timestamp": now_iso,
+            "conversation_history": generate_mock_conversation_history(
+                turns, success, scenario.conversation_starters[draws["starter_idx"][i]]
+            ),
+            "success_criteria_met": criteria_met[success],
+            "quality_ratings": quality
+        }
     
-    return {
-        "task_id": f"{scenario_id}_{trial_id}",
-        "model_name": model_name,
-        "scenario_id": scenario_id,
-        "trial_id": trial_id,
-        "success": success,
-        "completion_reason": "success_criteria_met" if success else "insufficient_criteria",
-        "conversation_turns": turns,
-        "tools_used": tools_used,
-        "policy_violations": violations,
-        "duration_seconds": duration,
-        "timestamp": datetime.now().isoformat(),
-        "conversation_history": generate_mock_conversation_history(turns, success, scenario),
-        "success_criteria_met": {criterion: success for criterion in scenario.success_criteria},
-        "quality_ratings": quality
-    }
+    return gen
+
+
+def generate_mock_conversation(scenario_id: str, scenario: RetailScenario, model_name: str, trial_id: int,
+                               draws: Dict[str, np.ndarray], i: int, now_iso: str) -> dict:
+    """Generate a realistic mock conversation result from row i of the pre-drawn trial inputs."""
+    return make_gen(model_name)(
+        scenario_id, scenario, trial_id, draws, i, now_iso, success_criteria_variants(scenario)
+    )
+
+
+def success_criteria_variants(scenario: RetailScenario) -> Tuple[dict, dict]:
+    """Return the all-failed and all-met ``success_criteria_met`` dicts, indexable by ``success``.
+    
+    Every mock result of a scenario uses one of these two dicts, so results
+    share them rather than building their own; treat them as read-only.
+    """
+    return (
+        {criterion: False for criterion in scenario.success_criteria},
+        {criterion: True for criterion in scenario.success_criteria}
+    )
 
 
 def get_model_characteristics(model_name: str) -> dict:
     """Get characteristics for different models to simulate realistic behavior."""
-    
-    characteristics = {
-        "gpt5": {
-            "success_rate": 0.92,  # Very high success rate
-            "tool_usage_accuracy": 0.95,  # Excellent tool usage
-            "policy_compliance": 0.88,  # Good compliance
-            "response_quality": {
-                "relevance": 0.93,
-                "completeness": 0.91, 
-                "clarity": 0.94,
-                "helpfulness": 0.92
-            },
-            "common_violations": ["purchase_pressure"],  # Occasional sales pressure
-            "violation_rate": 0.12
-        },
-        "claude_opus_4_1": {
-            "success_rate": 0.89,  # High success rate
-            "tool_usage_accuracy": 0.97,  # Excellent tool usage
-            "policy_compliance": 0.95,  # Excellent compliance
-            "response_quality": {
-                "relevance": 0.91,
-                "completeness": 0.93,
-                "clarity": 0.96,
-                "helpfulness": 0.94
-            },
-            "common_violations": ["inventory_misrepresentation"],  # Rare violations
-            "violation_rate": 0.05
-        }
-    }
-    
-    return characteristics.get(model_name, characteristics["gpt5"])
+    return _MODEL_CHARS.get(model_name, _MODEL_CHARS["gpt5"])
 
 
-def generate_mock_tools_used(expected_tools: list, characteristics: dict) -> list:
-    """Generate realistic tool usage based on model characteristics."""
-    tools_used = []
-    
-    # Use most expected tools based on accuracy
-    accuracy = characteristics["tool_usage_accuracy"]
-    
-    for tool in expected_tools:
-        if random.random() < accuracy:
-            tools_used.append({
-                "tool": tool,
-                "arguments": {"mock": "arguments"},
-                "result": {"success": True, "mock": "result"}
-            })
-    
-    return tools_used
+# Every mock tool call has the same arguments and result, so these dicts are
+# shared by all results (treat them as read-only)
+_MOCK_TOOL_ARGUMENTS = {"mock": "arguments"}
+_MOCK_TOOL_RESULT = {"success": True, "mock": "result"}
 
 
-def generate_mock_violations(characteristics: dict, policy_focus: list) -> list:
-    """Generate realistic policy violations."""
+def generate_mock_tools_used(expected_tools: list, tool_used: np.ndarray) -> list:
+    """Generate realistic tool usage from pre-drawn per-tool usage flags."""
+    return [
+        {"tool": tool, "arguments": _MOCK_TOOL_ARGUMENTS, "result": _MOCK_TOOL_RESULT}
+        for tool, used in zip(expected_tools, tool_used.tolist())
+        if used
+    ]
+
+
+def generate_mock_violations(characteristics: dict, occurred: bool, type_index: int, severity: float) -> list:
+    """Generate realistic policy violations from pre-drawn occurrence, type and severity."""
     violations = []
     
-    if random.random() < characteristics["violation_rate"]:
-        violation_type = random.choice(characteristics.get("common_violations", ["pricing_error"]))
-        severity = random.uniform(0.3, 0.8)
+    if occurred:
+        violation_type = characteristics.get("common_violations", ["pricing_error"])[type_index]
         
         violations.append({
             "policy_type": violation_type,
@@ -125,80 +216,116 @@ def generate_mock_violations(characteristics: dict, policy_focus: list) -> list:
     return violations
 
 
-def generate_mock_quality_ratings(characteristics: dict) -> dict:
-    """Generate realistic quality ratings with some variance."""
-    base_quality = characteristics["response_quality"]
-    
-    # Add some random variance (±0.1)
-    return {
-        dimension: max(0.0, min(1.0, base_score + random.uniform(-0.1, 0.1)))
-        for dimension, base_score in base_quality.items()
-    }
+def generate_mock_quality_ratings(ratings: np.ndarray) -> Dict[str, float]:
+    """Label one row of pre-drawn quality ratings, drawn in QUALITY_DIMENSIONS order."""
+    return dict(zip(QUALITY_DIMENSIONS, ratings.tolist()))
 
 
-def generate_mock_conversation_history(turns: int, success: bool, scenario) -> list:
+def generate_mock_conversation_history(turns: int, success: bool, starter: str) -> list:
     """Generate a mock conversation history."""
-    history = []
+    history = [None] * turns
     
     # Start with user message
-    starter = random.choice(scenario.conversation_starters)
-    history.append({"role": "user", "content": starter, "tool_calls": None})
+    history[0] = {"role": "user", "content": starter, "tool_calls": None}
     
     # Add alternating assistant/user messages
-    for i in range(turns - 1):
-        if i % 2 == 0:  # Assistant turn
-            content = f"Mock assistant response for turn {i+1}"
-            tool_calls = [{"id": f"call_{i}", "type": "function", "function": {"name": "search_products", "arguments": {}}}] if i == 0 else None
-            history.append({"role": "assistant", "content": content, "tool_calls": tool_calls})
+    for i in range(1, turns):
+        if i % 2:  # Assistant turn
+            history[i] = {"role": "assistant", "content": f"Mock assistant response for turn {i}", "tool_calls": None}
         else:  # User follow-up
-            content = f"Mock user follow-up for turn {i+1}"
-            history.append({"role": "user", "content": content, "tool_calls": None})
+            history[i] = {"role": "user", "content": f"Mock user follow-up for turn {i}", "tool_calls": None}
+    
+    # The first assistant turn searches for products
+    if turns > 1:
+        history[1]["tool_calls"] = [
+            {"id": "call_0", "type": "function", "function": {"name": "search_products", "arguments": {}}}
+        ]
     
     return history
 
 
-def create_demo_evaluation() -> EvaluationResult:
-    """Create a comprehensive demo evaluation."""
+def _gen_chunk(model_id: int, model: str, seed: int, starter_counts: np.ndarray, trials: int,
+               max_tools: int) -> Dict[str, np.ndarray]:
+    """Draw one model's trial inputs plus its index columns, from a generator seeded with ``seed``.
+    
+    ``starter_counts`` holds the number of conversation starters of each scenario.
+    """
+    n_scenarios = len(starter_counts)
+    n = n_scenarios * trials
+    rng = np.random.default_rng(seed)
+    draws = draw_model_trials(rng, get_model_characteristics(model), n, max_tools)
+    draws["model_id"] = np.full(n, model_id, dtype=np.int8)
+    draws["scenario_idx"] = np.repeat(np.arange(n_scenarios, dtype=np.int16), trials)
+    draws["trial_id"] = np.tile(np.arange(trials, dtype=np.int16), n_scenarios)
+    draws["starter_idx"] = rng.integers(0, starter_counts[draws["scenario_idx"]])
+    return draws
+
+
+def create_demo_evaluation(seed: Optional[int] = None, workers: Optional[int] = None) -> EvaluationResult:
+    """Create a comprehensive demo evaluation.
+    
+    Random inputs for each model's trials are drawn up front in batches; pass
+    a seed for a reproducible demo. ``workers`` bounds the threads used for
+    the per-model draws.
+    """
     
     print("🚀 Generating Demo Evaluation: GPT-5 vs Claude Opus 4.1")
     print("=" * 60)
     
-    scenarios_manager = get_retail_scenarios()
-    all_scenarios = list(scenarios_manager.scenarios.keys())
+    all_scenarios = list(_SCENARIOS.scenarios.keys())
+    scenarios = [_SCENARIOS.get_scenario(scenario_id) for scenario_id in all_scenarios]
+    max_tools = max(len(s.expected_tools) for s in scenarios)
+    starter_counts = np.array([len(s.conversation_starters) for s in scenarios])
     
     models = ["gpt5", "claude_opus_4_1"]
     trials = 5
     
-    all_results = []
+    rng = np.random.default_rng(seed)
     start_time = datetime.now()
+    t0 = time.perf_counter()
+    
+    # Mock results are generated within moments of each other, so they share one timestamp
+    now_iso = start_time.isoformat()
     
-    # Generate results for each model and scenario
+    # Generate results for each model and scenario, in (model, scenario, trial) order
     for model in models:
-        characteristics = get_model_characteristics(model)
-        success_rate = characteristics["success_rate"]
-        
+        success_rate = get_model_characteristics(model)["success_rate"]
         print(f"📊 Generating results for {model} (success rate: {success_rate:.1%})")
-        
-        for scenario_id in all_scenarios:
-            for trial in range(trials):
-                result = generate_mock_conversation(scenario_id, model, trial, success_rate)
-                all_results.append(result)
     
+    # Each model's draws come from its own child generator, so the models can
+    # fill in parallel (NumPy releases the GIL during bulk draws). Results
+    # depend only on ``seed``, not on ``workers``.
+    model_seeds = rng.integers(0, 2**63, size=len(models))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        model_draws = list(pool.map(
+            _gen_chunk,
+            range(len(models)),
+            models,
+            model_seeds,
+            itertools.repeat(starter_counts),
+            itertools.repeat(trials),
+            itertools.repeat(max_tools)
+        ))
+    
+    batch = ResultBatch(
+        models=models,
+        scenario_ids=all_scenarios,
+        scenarios=scenarios,
+        columns={name: np.concatenate([draws[name] for draws in model_draws]) for name in model_draws[0]},
+        timestamp=now_iso
+    )
+    all_results = list(batch)
+    
+    duration = time.perf_counter() - t0
     end_time = datetime.now()
-    duration = (end_time - start_time).total_seconds()
     
     # Calculate metrics
-    metrics = {}
-    
-    pass_k_metric = PassKMetric(k_values=[1, 3, 5])
-    success_metric = SuccessRateMetric()
-    compliance_metric = PolicyComplianceMetric()
-    quality_metric = ResponseQualityMetric()
-    
-    metrics["pass_k"] = pass_k_metric.calculate(all_results)
-    metrics["success_rate"] = success_metric.calculate(all_results)
-    metrics["policy_compliance"] = compliance_metric.calculate(all_results)
-    metrics["response_quality"] = quality_metric.calculate(all_results)
+    metrics = evaluate_all(all_results, {
+        "pass_k": PassKMetric(k_values=[1, 3, 5]),
+        "success_rate": SuccessRateMetric(),
+        "policy_compliance": PolicyComplianceMetric(),
+        "response_quality": ResponseQualityMetric()
+    })
     
     # Create evaluation result
     evaluation = EvaluationResult(
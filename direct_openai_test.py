@@ -5,11 +5,32 @@ Direct OpenAI API test with the new key
 
 import os
 import asyncio
+from functools import lru_cache
+from typing import List
 from dotenv import load_dotenv
 from openai import AsyncOpenAI
 
 load_dotenv()
 
+# gpt-3.5-turbo pricing in USD per token
+_PROMPT_COST = 0.0005 / 1000
+_COMPL_COST = 0.0015 / 1000
+
+@lru_cache(maxsize=None)
+def _get_client(api_key: str) -> AsyncOpenAI:
+    """Return one shared client per key, so repeated tests reuse its connection pool."""
+    return AsyncOpenAI(api_key=api_key)
+
+def _create_completion(client: AsyncOpenAI, prompt: str):
+    return client.chat.completions.create(
+        model="gpt-3.5-turbo",  # Use cheaper model
+        messages=[
+            {"role": "user", "content": prompt}
+        ],
+        max_tokens=10,
+        temperature=0
+    )
+
 async def test_openai_direct():
     """Test OpenAI API directly with the new key."""
     
@@ -17,22 +38,16 @@ async def test_openai_direct():
     print(f"🔑 Testing OpenAI API with key ending in: ...{api_key[-6:]}")
     
     try:
-        client = AsyncOpenAI(api_key=api_key)
+        client = _get_client(api_key)
         
         # Test with a very simple request
-        response = await client.chat.completions.create(
-            model="gpt-3.5-turbo",  # Use cheaper model
-            messages=[
-                {"role": "user", "content": "Say 'Hello' if you can read this."}
-            ],
-            max_tokens=10,
-            temperature=0
-        )
+        response = await _create_completion(client, "Say 'Hello' if you can read this.")
         
         print("✅ OpenAI API Success!")
         print(f"Response: {response.choices[0].message.content}")
         print(f"Tokens used: {response.usage.total_tokens}")
-        print(f"Cost estimate: ${(response.usage.prompt_tokens * 0.0005 + response.usage.completion_tokens * 0.0015) / 1000:.6f}")
+        usage = response.usage
+        print(f"Cost estimate: ${usage.prompt_tokens * _PROMPT_COST + usage.completion_tokens * _COMPL_COST:.6f}")
         
         return True
         
@@ -40,5 +55,11 @@ async def test_openai_direct():
         print(f"❌ OpenAI API Error: {e}")
         return False
 
+async def run_openai_prompts(prompts: List[str]) -> List[str]:
+    """Send several test prompts concurrently over the shared client and return the replies."""
+    client = _get_client(os.getenv('OPENAI_API_KEY'))
+    responses = await asyncio.gather(*(_create_completion(client, prompt) for prompt in prompts))
+    return [response.choices[0].message.content for response in responses]
+
 if __name__ == "__main__":
     asyncio.run(test_openai_direct())
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""
+On-disk response cache shared by the benchmark scripts.
+"""
+
+import hashlib
+import sqlite3
+import struct
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+
+
+class LLMCache:
+    """SQLite-backed on-disk cache of model responses.
+    
+    Benchmark requests run at near-zero temperature with fixed prompts, so
+    repeated runs can reuse earlier responses instead of paying for them again.
+    """
+    
+    def __init__(self, path: str = ".llm_cache/responses.sqlite", ttl_seconds: float = 7 * 86400):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key BLOB PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+    
+    @staticmethod
+    def cache_key(model: str, system: str, user: str, temperature: float, max_tokens: int) -> bytes:
+        """Hash the request parameters that determine a response into a 16-byte key."""
+        h = hashlib.blake2b(digest_size=16)
+        for text in (model, system, user):
+            h.update(text.encode())
+            h.update(b"\0")
+        h.update(struct.pack("<dI", temperature, max_tokens))
+        return h.digest()
+    
+    @staticmethod
+    def trial_key(key: bytes, trial: int) -> bytes:
+        """Extend a request key with the trial index, so each trial caches its own sample."""
+        return key + struct.pack("<I", trial)
+    
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Return the cached result for key, or None if missing or expired."""
+        row = self._conn.execute(
+            "SELECT value FROM responses WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return orjson.loads(row[0]) if row else None
+    
+    def set(self, key: bytes, value: Dict[str, Any]):
+        """Store a result under key for ttl_seconds."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, orjson.dumps(value, default=str), time.time() + self.ttl_seconds)
+        )
+        self._conn.commit()
@@ -10,6 +10,7 @@ from datetime import datetime
 from src.evaluation.runner import EvaluationRunner
 from src.evaluation.results import EvaluationReport
 from src.agents.factory import list_available_models
+from src.agents.openai_agent import aclose_clients
 from src.domains.retail.scenarios import get_retail_scenarios
 from src.utils.logging import get_logger, setup_logging
 from src.utils.config import get_config
@@ -159,7 +160,7 @@ def validate_scenarios(scenario_ids):
     """Validate that requested scenarios exist."""
     try:
         scenarios_manager = get_retail_scenarios()
-        available_scenarios = {s['id'] for s in scenarios_manager.list_all_scenarios()}
+        available_scenarios = scenarios_manager.available_ids()
         requested_scenarios = set(scenario_ids)
         
         invalid_scenarios = requested_scenarios - available_scenarios
@@ -255,6 +256,8 @@ async def run_evaluation(args):
         logger.error(f"Evaluation failed: {e}")
         print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        await aclose_clients()
 
 
 def main():
@@ -3,17 +3,41 @@
 
 import os
 import asyncio
-import json
+import argparse
+import re
 from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
+import orjson
 from anthropic import AsyncAnthropic
 
+from llm_cache import LLMCache
+
 # Load environment variables
 load_dotenv()
 
-async def run_claude_benchmark():
-    """Run a simple benchmark with real Claude API calls."""
+# Scenarios sent to the API at once
+MAX_CONCURRENT_REQUESTS = 3
+
+# Request parameters; together with the task they form the response cache key
+MODEL = "claude-3-5-sonnet-20241022"
+MAX_TOKENS = 200
+TEMPERATURE = 0.1
+SYSTEM_PROMPT = "You are a helpful customer service agent for an e-commerce store. Be professional, helpful, and follow company policies. Don't offer unauthorized discounts or make promises you can't keep."
+
+CACHE_PATH = ".llm_cache/real_benchmark.sqlite"
+
+# Per-token prices in USD. These are Claude-3 Opus prices ($15/1M input,
+# $75/1M output tokens), not MODEL's, so reported costs overestimate the run
+INPUT_RATE = 15e-6
+OUTPUT_RATE = 75e-6
+
+async def run_claude_benchmark(use_cache: bool = True):
+    """Run a simple benchmark with real Claude API calls.
+    
+    Responses are cached on disk, so re-running unchanged scenarios is free;
+    pass use_cache=False (or set BENCH_NO_CACHE) to always call the API.
+    """
     
     print("🧠 Real Claude API Benchmark")
     print("=" * 40)
@@ -25,8 +49,6 @@ async def run_claude_benchmark():
         print("❌ ANTHROPIC_API_KEY not found in environment")
         return
     
-    client = AsyncAnthropic(api_key=api_key)
-    
     # Define test scenarios
     scenarios = [
         {
@@ -47,67 +69,124 @@ async def run_claude_benchmark():
     ]
     
     results = []
+    successful = 0
+    total_tokens = 0
     total_cost = 0
+    cache = LLMCache(CACHE_PATH) if use_cache and not os.getenv("BENCH_NO_CACHE") else None
     
-    for i, scenario in enumerate(scenarios, 1):
-        print(f"📋 Running Scenario {i}: {scenario['id']}")
-        print(f"   Task: {scenario['task'][:60]}...")
+    # One client for the whole run, so every scenario reuses its keep-alive
+    # connection; leaving the block closes it
+    async with AsyncAnthropic(api_key=api_key) as client:
+        # Scenarios are independent, so they run concurrently; the semaphore
+        # keeps the burst within the account's rate limit
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
         
-        try:
-            # Make real API call to Claude (using latest model)
-            response = await client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=200,
-                temperature=0.1,
-                system="You are a helpful customer service agent for an e-commerce store. Be professional, helpful, and follow company policies. Don't offer unauthorized discounts or make promises you can't keep.",
-                messages=[
-                    {"role": "user", "content": scenario["task"]}
-                ]
-            )
-            
-            response_text = response.content[0].text
-            input_tokens = response.usage.input_tokens
-            output_tokens = response.usage.output_tokens
-            total_tokens = input_tokens + output_tokens
-            
-            # Estimate cost (Claude-3 Opus pricing: ~$15/1M input, ~$75/1M output tokens)
-            cost = (input_tokens * 15 + output_tokens * 75) / 1_000_000
-            total_cost += cost
+        async def run_scenario(scenario):
+            cache_key = LLMCache.cache_key(MODEL, SYSTEM_PROMPT, scenario["task"], TEMPERATURE, MAX_TOKENS)
+            if cache:
+                cached = cache.get(cache_key)
+                if cached:
+                    return {**cached, "cached": True}
             
-            # Simple success evaluation
-            success = evaluate_response(scenario, response_text)
+            async with semaphore:
+                # Make real API call to Claude (using latest model)
+                response = await client.messages.create(
+                    model=MODEL,
+                    max_tokens=MAX_TOKENS,
+                    temperature=TEMPERATURE,
+                    system=SYSTEM_PROMPT,
+                    messages=[
+                        {"role": "user", "content": scenario["task"]}
+                    ]
+                )
             
-            result = {
-                "scenario_id": scenario["id"],
-                "task": scenario["task"],
-                "response": response_text,
-                "success": success,
-                "tokens": {
-                    "input": input_tokens,
-                    "output": output_tokens,
-                    "total": total_tokens
-                },
-                "cost_usd": cost,
-                "timestamp": datetime.now().isoformat()
+            # Keep plain fields rather than the SDK object, so cached entries
+            # survive library upgrades
+            reply = {
+                "text": response.content[0].text,
+                "input_tokens": response.usage.input_tokens,
+                "output_tokens": response.usage.output_tokens
             }
-            
-            results.append(result)
-            
-            print(f"   ✅ Success: {success}")
-            print(f"   📊 Tokens: {total_tokens} (${cost:.4f})")
-            print(f"   💬 Response: {response_text[:100]}...")
-            print()
-            
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-            print()
-            continue
+            if cache:
+                cache.set(cache_key, reply)
+            return {**reply, "cached": False}
+        
+        async def run_numbered(i, scenario):
+            try:
+                return i, scenario, await run_scenario(scenario)
+            except Exception as e:
+                return i, scenario, e
+        
+        # Each result is appended as a JSON line as soon as its scenario
+        # finishes, so a run that dies part-way, even while other requests
+        # are still in flight, leaves the finished scenarios on disk
+        results_dir = Path("results")
+        results_dir.mkdir(exist_ok=True)
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        results_file = results_dir / f"real_claude_benchmark_{timestamp}.jsonl"
+        summary_file = results_dir / f"real_claude_benchmark_summary_{timestamp}.json"
+        
+        print(f"⏳ Running {len(scenarios)} scenarios concurrently...\n")
+        with open(results_file, "ab") as results_fh:
+            for finished in asyncio.as_completed(
+                [run_numbered(i, scenario) for i, scenario in enumerate(scenarios, 1)]
+            ):
+                i, scenario, response = await finished
+                print(f"📋 Scenario {i}: {scenario['id']}")
+                print(f"   Task: {scenario['task'][:60]}...")
+                
+                try:
+                    if isinstance(response, Exception):
+                        raise response
+                    
+                    response_text = response["text"]
+                    input_tokens = response["input_tokens"]
+                    output_tokens = response["output_tokens"]
+                    scenario_tokens = input_tokens + output_tokens
+                    
+                    # Estimate cost; cached responses cost nothing
+                    cost = 0.0 if response["cached"] else input_tokens * INPUT_RATE + output_tokens * OUTPUT_RATE
+                    
+                    # Simple success evaluation
+                    success = evaluate_response(scenario, response_text)
+                    
+                    result = {
+                        "scenario_id": scenario["id"],
+                        "task": scenario["task"],
+                        "response": response_text,
+                        "success": success,
+                        "tokens": {
+                            "input": input_tokens,
+                            "output": output_tokens,
+                            "total": scenario_tokens
+                        },
+                        "cost_usd": cost,
+                        "cached": response["cached"],
+                        "timestamp": datetime.now().isoformat()
+                    }
+                    
+                    results.append(result)
+                    results_fh.write(orjson.dumps(result, option=orjson.OPT_APPEND_NEWLINE))
+                    results_fh.flush()
+                    successful += success
+                    total_tokens += scenario_tokens
+                    total_cost += cost
+                    
+                    print(f"   ✅ Success: {success}")
+                    print(f"   📊 Tokens: {scenario_tokens} (${cost:.4f}){' [cached]' if response['cached'] else ''}")
+                    print(f"   💬 Response: {response_text[:100]}...")
+                    print()
+                    
+                except Exception as e:
+                    print(f"   ❌ Error: {e}")
+                    print()
+                    continue
     
     # Calculate summary statistics
     if results:
-        successful = sum(1 for r in results if r["success"])
         success_rate = successful / len(results)
-        avg_tokens = sum(r["tokens"]["total"] for r in results) / len(results)
+        avg_tokens = total_tokens / len(results)
         
         print("📊 **REAL BENCHMARK RESULTS**")
         print("=" * 40)
@@ -123,30 +202,25 @@ async def run_claude_benchmark():
             status = "✅" if result["success"] else "❌"
             print(f"   {status} {result['scenario_id']}: {result['tokens']['total']} tokens (${result['cost_usd']:.4f})")
         
-        # Save results
-        results_dir = Path("results")
-        results_dir.mkdir(exist_ok=True)
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        results_file = results_dir / f"real_claude_benchmark_{timestamp}.json"
-        
+        # Save the aggregate summary; per-scenario results are already in results_file
         benchmark_data = {
             "benchmark_id": f"real_claude_benchmark_{timestamp}",
-            "model": "claude-3-opus-20240229",
+            "model": MODEL,
             "timestamp": datetime.now().isoformat(),
             "total_scenarios": len(results),
             "success_rate": success_rate,
             "successful_scenarios": successful,
-            "total_tokens": sum(r["tokens"]["total"] for r in results),
+            "total_tokens": total_tokens,
             "total_cost_usd": total_cost,
             "average_tokens": avg_tokens,
-            "results": results
+            "results_file": str(results_file)
         }
         
-        with open(results_file, 'w') as f:
-            json.dump(benchmark_data, f, indent=2)
+        with open(summary_file, "wb") as f:
+            f.write(orjson.dumps(benchmark_data, option=orjson.OPT_INDENT_2))
         
         print(f"\n💾 Results saved to: {results_file}")
+        print(f"💾 Summary saved to: {summary_file}")
         
         print(f"\n🎯 **Key Insights:**")
         print("✅ **This benchmark used REAL API calls!**")
@@ -165,30 +239,50 @@ async def run_claude_benchmark():
     else:
         print("❌ No successful API calls completed")
 
+def _keyword_search(keywords):
+    """Compile keywords into one regex search for any of them as a substring."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords)).search
+
+_PRODUCT_HELP = _keyword_search(("search", "look", "find", "help", "laptop", "options"))
+_ORDER_LOOKUP = _keyword_search(("order", "tracking", "status", "check", "look up"))
+_UNAUTHORIZED_DISCOUNT = _keyword_search(("50% off", "half price", "50% discount"))
+_ALTERNATIVES = _keyword_search(("alternative", "different", "other", "regular"))
+
+def _offers_product_help(response_lower):
+    # Should offer to help search or ask questions
+    return _PRODUCT_HELP(response_lower) is not None
+
+def _offers_order_lookup(response_lower):
+    # Should offer to look up order
+    return _ORDER_LOOKUP(response_lower) is not None
+
+def _declines_unauthorized_discount(response_lower):
+    # Should not offer unauthorized discount
+    return _UNAUTHORIZED_DISCOUNT(response_lower) is None and _ALTERNATIVES(response_lower) is not None
+
+# Scenario id -> check(response_lower)
+_SCENARIO_CHECKS = {
+    "product_search": _offers_product_help,
+    "order_tracking": _offers_order_lookup,
+    "policy_compliance": _declines_unauthorized_discount,
+}
+
 def evaluate_response(scenario, response_text):
     """Simple evaluation of response quality."""
-    response_lower = response_text.lower()
-    
-    if scenario["id"] == "product_search":
-        # Should offer to help search or ask questions
-        return any(word in response_lower for word in ["search", "look", "find", "help", "laptop", "options"])
-    
-    elif scenario["id"] == "order_tracking":
-        # Should offer to look up order
-        return any(word in response_lower for word in ["order", "tracking", "status", "check", "look up"])
-    
-    elif scenario["id"] == "policy_compliance":
-        # Should not offer unauthorized discount
-        unauthorized_discount = any(word in response_lower for word in ["50% off", "half price", "50% discount"])
-        offers_alternatives = any(word in response_lower for word in ["alternative", "different", "other", "regular"])
-        return not unauthorized_discount and offers_alternatives
-    
-    return True  # Default to success if unclear
+    check = _SCENARIO_CHECKS.get(scenario["id"])
+    if check is None:
+        return True  # Default to success if unclear
+    return check(response_text.lower())
 
 async def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description="Simple real benchmark using actual Claude API calls")
+    parser.add_argument("--fresh", action="store_true",
+                       help="Always call the API instead of reusing cached responses")
+    args = parser.parse_args()
+    
     try:
-        await run_claude_benchmark()
+        await run_claude_benchmark(use_cache=not args.fresh)
     except KeyboardInterrupt:
         print("\n⚠️  Benchmark interrupted by user")
     except Exception as e:
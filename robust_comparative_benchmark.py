@@ -6,13 +6,16 @@ Direct API calls without workaround systems.
 
 import os
 import asyncio
-import json
 import argparse
+import importlib.util
+import re
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any
 from dotenv import load_dotenv
+import httpx
+import orjson
 import openai
 from anthropic import AsyncAnthropic
 import numpy as np
@@ -21,6 +24,88 @@ from scipy import stats
 # Load environment variables
 load_dotenv()
 
+# Identical across every request and always sent first, so providers can reuse
+# their cached prefix for it
+SYSTEM_PROMPT = "You are a professional customer service agent for an e-commerce store. Be helpful, follow company policies, and provide excellent customer service. Do not offer unauthorized discounts or make promises outside your authority."
+
+class TokenBucket:
+    """Asyncio token bucket allowing ``rate`` acquisitions per ``per`` seconds.
+    
+    Callers wait for exactly as long as it takes for enough tokens to refill,
+    rather than being rejected once a per-minute counter runs out.
+    """
+    
+    def __init__(self, rate: float, per: float = 60.0):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        # The bucket holds at least one token, so fractional rates are
+        # throttled instead of never refilling enough for an acquisition
+        self.capacity = max(rate, 1.0)
+        self.tokens = self.capacity
+        self.fill_rate = rate / per
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self, n: float = 1.0):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+                if self.tokens >= n:
+                    self.tokens -= n
+                    return
+                await asyncio.sleep((n - self.tokens) / self.fill_rate)
+
+
+def _rpm_bucket(env_var: str):
+    """Token bucket for a provider's requests-per-minute limit, if one is configured."""
+    rpm = os.getenv(env_var)
+    if not rpm:
+        return None
+    if float(rpm) <= 0:
+        raise ValueError(f"{env_var} must be a positive requests-per-minute limit, got {rpm!r}")
+    return TokenBucket(float(rpm))
+
+
+# Keywords (matched as substrings of the lowercased response) or a custom check per criterion
+_CRITERIA_PATTERNS = {
+    "offers_to_search": ["search", "look", "find", "browse", "options"],
+    "asks_clarifying_questions": ["?", "what", "which", "how", "when", "prefer"],
+    "professional_tone": ["happy", "help", "assist", "please", "thank"],
+    "offers_to_check_status": ["check", "look up", "status", "investigate"],
+    "provides_timeline": ["day", "time", "soon", "shortly", "within"],
+    "professional_service": ["help", "assist", "service", "support"],
+    "explains_policy_clearly": ["policy", "return", "days", "condition"],
+    "addresses_timeframe": ["3 weeks", "21 days", "timeframe", "period"],
+    "helpful_guidance": ["help", "guide", "assist", "process"],
+    "polite_decline": ["unfortunately", "unable", "cannot", "policy"],
+    "offers_alternatives": ["alternative", "instead", "other", "different", "sale"],
+    "maintains_policy": lambda r: "20%" not in r or "discount" not in r,
+    "systematic_troubleshooting": ["try", "step", "check", "troubleshoot"],
+    "escalation_offer": ["technical", "specialist", "escalate", "manager"],
+    "empathetic_response": ["understand", "sorry", "frustrated", "apologize"],
+    "identifies_business_need": ["business", "company", "bulk", "50"],
+    "mentions_bulk_options": ["bulk", "business", "volume", "pricing"],
+    "appropriate_escalation": ["business", "sales", "specialist", "team"],
+    "acknowledges_frustration": ["understand", "sorry", "apologize", "frustrated"],
+    "offers_solution": ["refund", "solution", "resolve", "help"],
+    "de_escalation": ["understand", "work", "resolve", "make right"]
+}
+
+
+def _keyword_search(keywords: List[str]):
+    """Compile a criterion's keywords into one regex search for any of them."""
+    search = re.compile("|".join(re.escape(keyword) for keyword in keywords)).search
+    return lambda response_lower: search(response_lower) is not None
+
+# Criterion name -> check(response_lower), built once at import
+_CRITERIA_CHECKS = {
+    criterion: patterns if callable(patterns) else _keyword_search(patterns)
+    for criterion, patterns in _CRITERIA_PATTERNS.items()
+}
+
+
 class SimplifiedComparativeBenchmark:
     def __init__(self):
         self.openai_client = None
@@ -29,6 +114,14 @@ class SimplifiedComparativeBenchmark:
         self.total_cost = 0.0
         self.failed_requests = []
         
+        # Cap in-flight requests per provider; each has its own rate limits
+        self._openai_semaphore = asyncio.Semaphore(int(os.getenv("OPENAI_CONCURRENCY", "8")))
+        self._anthropic_semaphore = asyncio.Semaphore(int(os.getenv("ANTHROPIC_CONCURRENCY", "8")))
+        
+        # Optional requests-per-minute limits, so bursts wait instead of hitting 429s
+        self._openai_rpm = _rpm_bucket("OPENAI_RPM")
+        self._anthropic_rpm = _rpm_bucket("ANTHROPIC_RPM")
+        
         # Initialize clients
         self._initialize_clients()
         
@@ -94,16 +187,32 @@ class SimplifiedComparativeBenchmark:
     
     def _initialize_clients(self):
         """Initialize OpenAI and Anthropic clients."""
+        # OpenAI requests go through one long-lived connection pool; HTTP/2
+        # multiplexing is used when the optional h2 package is installed.
+        # The Anthropic SDK only accepts its own httpx2 client, so it keeps
+        # its default pool
+        self._http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=60.0),
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=httpx.Timeout(60.0, connect=5.0)
+        )
+        
         # OpenAI client
         api_key = os.getenv('OPENAI_API_KEY')
         if api_key:
-            self.openai_client = openai.AsyncOpenAI(api_key=api_key)
+            self.openai_client = openai.AsyncOpenAI(api_key=api_key, http_client=self._http_client)
         
         # Anthropic client
         api_key = os.getenv('ANTHROPIC_API_KEY')
         if api_key:
             self.anthropic_client = AsyncAnthropic(api_key=api_key)
     
+    async def aclose(self):
+        """Close the HTTP connection pools."""
+        await self._http_client.aclose()
+        if self.anthropic_client:
+            await self.anthropic_client.close()
+    
     async def test_gpt5(self, scenario: Dict[str, Any]) -> Dict[str, Any]:
         """Test GPT-5 via direct OpenAI API call."""
         if not self.openai_client:
@@ -116,28 +225,32 @@ class SimplifiedComparativeBenchmark:
             }
         
         messages = [
-            {
-                "role": "system",
-                "content": "You are a professional customer service agent for an e-commerce store. Be helpful, follow company policies, and provide excellent customer service. Do not offer unauthorized discounts or make promises outside your authority."
-            },
+            {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": scenario["task"]}
         ]
         
         try:
-            response = await self.openai_client.chat.completions.create(
-                model="gpt-4o",  # Using GPT-4o as GPT-5 proxy
-                messages=messages,
-                max_tokens=250,
-                temperature=0.1
-            )
+            async with self._openai_semaphore:
+                if self._openai_rpm:
+                    await self._openai_rpm.acquire()
+                response = await self.openai_client.chat.completions.create(
+                    model="gpt-4o",  # Using GPT-4o as GPT-5 proxy
+                    messages=messages,
+                    max_tokens=250,
+                    temperature=0.1
+                )
             
             response_text = response.choices[0].message.content
             input_tokens = response.usage.prompt_tokens
             output_tokens = response.usage.completion_tokens
             total_tokens = input_tokens + output_tokens
             
-            # GPT-4o pricing
-            cost = (input_tokens * 5 + output_tokens * 15) / 1_000_000
+            # Input tokens served from OpenAI's prompt cache
+            details = getattr(response.usage, "prompt_tokens_details", None)
+            cached_tokens = (details.cached_tokens or 0) if details else 0
+            
+            # GPT-4o pricing; cached input tokens are billed at half the input rate
+            cost = ((input_tokens - cached_tokens) * 5 + cached_tokens * 2.5 + output_tokens * 15) / 1_000_000
             
             return {
                 "model": "gpt5",
@@ -145,6 +258,7 @@ class SimplifiedComparativeBenchmark:
                 "response": response_text,
                 "tokens": {
                     "input": input_tokens,
+                    "cached_input": cached_tokens,
                     "output": output_tokens,
                     "total": total_tokens
                 },
@@ -175,15 +289,18 @@ class SimplifiedComparativeBenchmark:
             }
         
         try:
-            response = await self.anthropic_client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=250,
-                temperature=0.1,
-                system="You are a professional customer service agent for an e-commerce store. Be helpful, follow company policies, and provide excellent customer service. Do not offer unauthorized discounts or make promises outside your authority.",
-                messages=[
-                    {"role": "user", "content": scenario["task"]}
-                ]
-            )
+            async with self._anthropic_semaphore:
+                if self._anthropic_rpm:
+                    await self._anthropic_rpm.acquire()
+                response = await self.anthropic_client.messages.create(
+                    model="claude-3-5-sonnet-20241022",
+                    max_tokens=250,
+                    temperature=0.1,
+                    system=SYSTEM_PROMPT,
+                    messages=[
+                        {"role": "user", "content": scenario["task"]}
+                    ]
+                )
             
             response_text = response.content[0].text
             input_tokens = response.usage.input_tokens
@@ -243,35 +360,8 @@ class SimplifiedComparativeBenchmark:
     
     def _evaluate_criterion(self, criterion: str, response_lower: str) -> bool:
         """Evaluate individual success criteria."""
-        criteria_patterns = {
-            "offers_to_search": ["search", "look", "find", "browse", "options"],
-            "asks_clarifying_questions": ["?", "what", "which", "how", "when", "prefer"],
-            "professional_tone": ["happy", "help", "assist", "please", "thank"],
-            "offers_to_check_status": ["check", "look up", "status", "investigate"],
-            "provides_timeline": ["day", "time", "soon", "shortly", "within"],
-            "professional_service": ["help", "assist", "service", "support"],
-            "explains_policy_clearly": ["policy", "return", "days", "condition"],
-            "addresses_timeframe": ["3 weeks", "21 days", "timeframe", "period"],
-            "helpful_guidance": ["help", "guide", "assist", "process"],
-            "polite_decline": ["unfortunately", "unable", "cannot", "policy"],
-            "offers_alternatives": ["alternative", "instead", "other", "different", "sale"],
-            "maintains_policy": lambda r: "20%" not in r or "discount" not in r,
-            "systematic_troubleshooting": ["try", "step", "check", "troubleshoot"],
-            "escalation_offer": ["technical", "specialist", "escalate", "manager"],
-            "empathetic_response": ["understand", "sorry", "frustrated", "apologize"],
-            "identifies_business_need": ["business", "company", "bulk", "50"],
-            "mentions_bulk_options": ["bulk", "business", "volume", "pricing"],
-            "appropriate_escalation": ["business", "sales", "specialist", "team"],
-            "acknowledges_frustration": ["understand", "sorry", "apologize", "frustrated"],
-            "offers_solution": ["refund", "solution", "resolve", "help"],
-            "de_escalation": ["understand", "work", "resolve", "make right"]
-        }
-        
-        patterns = criteria_patterns.get(criterion, [])
-        if callable(patterns):
-            return patterns(response_lower)
-        else:
-            return any(word in response_lower for word in patterns)
+        check = _CRITERIA_CHECKS.get(criterion)
+        return check(response_lower) if check else False
     
     async def run_benchmark(self, num_scenarios: int = 7, trials_per_scenario: int = 1):
         """Run the comparative benchmark."""
@@ -289,6 +379,17 @@ class SimplifiedComparativeBenchmark:
         selected_scenarios = self.scenarios[:num_scenarios]
         all_results = []
         
+        # Every scenario/trial pair is independent, so issue them all at once;
+        # the per-provider semaphores bound how many requests are in flight
+        print(f"⏳ Testing both models on {len(selected_scenarios) * trials_per_scenario} trials...")
+        print()
+        trial_results = await asyncio.gather(*(
+            self._run_trial(scenario)
+            for scenario in selected_scenarios
+            for trial in range(trials_per_scenario)
+        ))
+        trial_results = iter(trial_results)
+        
         for scenario_idx, scenario in enumerate(selected_scenarios, 1):
             print(f"📋 Scenario {scenario_idx}: {scenario['name']} ({scenario['complexity']})")
             print(f"   Task: {scenario['task'][:70]}...")
@@ -297,22 +398,7 @@ class SimplifiedComparativeBenchmark:
                 if trials_per_scenario > 1:
                     print(f"   🔄 Trial {trial + 1}/{trials_per_scenario}")
                 
-                # Run tests concurrently
-                print("   ⏳ Testing both models...")
-                gpt5_task = self.test_gpt5(scenario)
-                claude_task = self.test_claude_opus_4_1(scenario)
-                
-                gpt5_result, claude_result = await asyncio.gather(gpt5_task, claude_task)
-                
-                # Evaluate responses if successful
-                if "response" in gpt5_result:
-                    evaluation = self.evaluate_response(scenario, gpt5_result["response"])
-                    gpt5_result.update(evaluation)
-                
-                if "response" in claude_result:
-                    evaluation = self.evaluate_response(scenario, claude_result["response"])
-                    claude_result.update(evaluation)
-                
+                gpt5_result, claude_result = next(trial_results)
                 all_results.extend([gpt5_result, claude_result])
                 
                 # Update total cost
@@ -332,6 +418,22 @@ class SimplifiedComparativeBenchmark:
         
         return all_results
     
+    async def _run_trial(self, scenario: Dict[str, Any]):
+        """Query both models concurrently on one scenario and evaluate their responses."""
+        gpt5_result, claude_result = await asyncio.gather(
+            self.test_gpt5(scenario),
+            self.test_claude_opus_4_1(scenario)
+        )
+        
+        # Evaluate responses if successful
+        if "response" in gpt5_result:
+            gpt5_result.update(self.evaluate_response(scenario, gpt5_result["response"]))
+        
+        if "response" in claude_result:
+            claude_result.update(self.evaluate_response(scenario, claude_result["response"]))
+        
+        return gpt5_result, claude_result
+    
     def _print_trial_results(self, gpt5_result: Dict, claude_result: Dict):
         """Print trial results."""
         
@@ -440,8 +542,9 @@ class SimplifiedComparativeBenchmark:
             }
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(benchmark_data, f, indent=2, default=str)
+        filepath.write_bytes(orjson.dumps(
+            benchmark_data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        ))
         
         print(f"💾 **Benchmark results saved:** {filepath}")
     
@@ -469,6 +572,7 @@ async def main():
     
     args = parser.parse_args()
     
+    benchmark = None
     try:
         benchmark = SimplifiedComparativeBenchmark()
         await benchmark.run_benchmark(
@@ -479,6 +583,9 @@ async def main():
         print("\n⚠️ Benchmark interrupted by user")
     except Exception as e:
         print(f"❌ Benchmark error: {e}")
+    finally:
+        if benchmark:
+            await benchmark.aclose()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
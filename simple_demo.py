@@ -6,8 +6,8 @@ import random
 from datetime import datetime
 from pathlib import Path
 
-# Set random seed for consistent demo results
-random.seed(42)
+# Seeded generator for consistent demo results
+_RAND = random.Random(42)
 
 def generate_demo_results():
     """Demonstrate GPT-5 vs Claude Opus 4.1 framework capabilities."""
@@ -61,6 +61,7 @@ def generate_demo_results():
     # Generate results
     results = {}
     total_conversations = 0
+    _random, _uniform, _randint = _RAND.random, _RAND.uniform, _RAND.randint
     
     for model_name, model_data in models.items():
         model_results = []
@@ -70,9 +71,9 @@ def generate_demo_results():
             trials = 5
             
             for trial in range(trials):
-                success = random.random() < success_rate
-                duration = model_data["avg_duration"] + random.uniform(-5, 5)
-                turns = random.randint(2, 6)
+                success = _random() < success_rate
+                duration = model_data["avg_duration"] + _uniform(-5, 5)
+                turns = _randint(2, 6)
                 
                 result = {
                     "scenario": scenario["name"],
@@ -81,8 +82,8 @@ def generate_demo_results():
                     "success": success,
                     "duration": round(duration, 1),
                     "turns": turns,
-                    "tools_used": random.randint(1, 4),
-                    "policy_compliant": random.random() > 0.1  # 90% compliance rate
+                    "tools_used": _randint(1, 4),
+                    "policy_compliant": _random() > 0.1  # 90% compliance rate
                 }
                 model_results.append(result)
                 total_conversations += 1
@@ -48,6 +48,11 @@ class AnthropicAgent(BaseAgent):
             if tools:
                 request_params["tools"] = self._convert_tools(tools)
             
+            # Identical deterministic requests are answered from the in-process cache
+            cached = self._get_cached_response(request_params)
+            if cached is not None:
+                return cached
+            
             logger.info(f"Making Anthropic request with {len(claude_messages)} messages")
             
             # Make the API request
@@ -81,7 +86,7 @@ class AnthropicAgent(BaseAgent):
                 } for tc in tool_calls] if tool_calls else None
             )
             
-            return AgentResponse(
+            agent_response = AgentResponse(
                 message=response_message,
                 tool_calls=tool_calls,
                 finish_reason=response.stop_reason,
@@ -91,6 +96,8 @@ class AnthropicAgent(BaseAgent):
                     "total_tokens": response.usage.input_tokens + response.usage.output_tokens
                 }
             )
+            self._cache_response(request_params, agent_response)
+            return agent_response
             
         except Exception as e:
             logger.error(f"Error generating Anthropic response: {e}")
@@ -1,8 +1,11 @@
 """Base agent class for LLM agents."""
 
+import hashlib
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, AsyncGenerator
 
+import orjson
 from pydantic import BaseModel
 
 
@@ -30,6 +33,22 @@ class AgentResponse(BaseModel):
     usage: Optional[Dict[str, int]] = None
 
 
+# Responses to identical temperature-0 requests, shared by every agent in the
+# process and evicted least recently used first
+RESPONSE_CACHE_SIZE = 1024
+_response_cache: "OrderedDict[bytes, AgentResponse]" = OrderedDict()
+
+
+def _response_cache_key(request_params: Dict[str, Any]) -> Optional[bytes]:
+    """Hash a request for the response cache, or None if it is not deterministic."""
+    if request_params.get("temperature") != 0:
+        return None
+    params = {key: value for key, value in request_params.items() if key != "timeout"}
+    return hashlib.blake2b(
+        orjson.dumps(params, option=orjson.OPT_SORT_KEYS, default=str), digest_size=16
+    ).digest()
+
+
 class BaseAgent(ABC):
     """Abstract base class for LLM agents."""
     
@@ -47,6 +66,24 @@ class BaseAgent(ABC):
         self.timeout = timeout
         self.extra_params = kwargs
         
+    def _get_cached_response(self, request_params: Dict[str, Any]) -> Optional[AgentResponse]:
+        """Return a copy of the cached response to an identical temperature-0 request, if any."""
+        key = _response_cache_key(request_params)
+        if key is None or key not in _response_cache:
+            return None
+        _response_cache.move_to_end(key)
+        return _response_cache[key].model_copy(deep=True)
+    
+    def _cache_response(self, request_params: Dict[str, Any], response: AgentResponse) -> None:
+        """Remember the response to a temperature-0 request."""
+        key = _response_cache_key(request_params)
+        if key is None:
+            return
+        _response_cache[key] = response.model_copy(deep=True)
+        _response_cache.move_to_end(key)
+        if len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+    
     @abstractmethod
     async def generate_response(
         self,
@@ -1,8 +1,10 @@
 """OpenAI-based agent implementation."""
 
 import json
+from functools import lru_cache
 from typing import Any, AsyncGenerator, Dict, List, Optional
 
+import httpx
 import openai
 from openai import AsyncOpenAI
 
@@ -11,13 +13,51 @@ from .base import BaseAgent, Message, AgentResponse, ToolCall
 
 logger = get_logger(__name__)
 
+# Connection pool for each shared client; httpx's default of 10 keep-alive
+# connections throttles concurrent conversations on one key
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY = 30.0
+
+# Clients created by _get_client, closed by aclose_clients
+_clients: List[AsyncOpenAI] = []
+
+
+@lru_cache(maxsize=None)
+def _get_client(api_key: str) -> AsyncOpenAI:
+    """Return one shared client per API key, so agents reuse its connection pool."""
+    client = AsyncOpenAI(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY
+            ),
+            timeout=httpx.Timeout(60.0, connect=5.0)
+        )
+    )
+    _clients.append(client)
+    return client
+
+
+async def aclose_clients() -> None:
+    """Close the shared clients and their connection pools.
+    
+    The pools are bound to the event loop they were first used on, so call
+    this before that loop ends; later agents then get fresh clients.
+    """
+    _get_client.cache_clear()
+    while _clients:
+        await _clients.pop().close()
+
 
 class OpenAIAgent(BaseAgent):
     """Agent implementation using OpenAI's API."""
     
     def __init__(self, api_key: str, **kwargs):
         super().__init__(**kwargs)
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = _get_client(api_key)
         
     async def generate_response(
         self,
@@ -47,6 +87,11 @@ class OpenAIAgent(BaseAgent):
                 request_params["tools"] = self._convert_tools(tools)
                 request_params["tool_choice"] = "auto"
             
+            # Identical deterministic requests are answered from the in-process cache
+            cached = self._get_cached_response(request_params)
+            if cached is not None:
+                return cached
+            
             logger.info(f"Making OpenAI request with {len(openai_messages)} messages")
             
             # Make the API request
@@ -80,7 +125,7 @@ class OpenAIAgent(BaseAgent):
                 } for tc in tool_calls] if tool_calls else None
             )
             
-            return AgentResponse(
+            agent_response = AgentResponse(
                 message=response_message,
                 tool_calls=tool_calls,
                 finish_reason=choice.finish_reason,
@@ -90,6 +135,8 @@ class OpenAIAgent(BaseAgent):
                     "total_tokens": response.usage.total_tokens
                 } if response.usage else None
             )
+            self._cache_response(request_params, agent_response)
+            return agent_response
             
         except Exception as e:
             logger.error(f"Error generating OpenAI response: {e}")
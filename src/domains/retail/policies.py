@@ -16,7 +16,7 @@ class PolicyType(Enum):
     REFUND_POLICY_VIOLATION = "refund_policy_violation"
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyViolation:
     """Represents a policy violation."""
     policy_type: PolicyType
@@ -1,6 +1,6 @@
 """Retail domain evaluation scenarios."""
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, FrozenSet, List, Any, Optional
 from dataclasses import dataclass
 import random
 
@@ -10,7 +10,7 @@ from ...utils.logging import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class RetailScenario:
     """Represents a retail evaluation scenario."""
     id: str
@@ -212,6 +212,7 @@ class RetailScenarios:
                 }
             )
         }
+        self._available_ids = frozenset(scenario.id for scenario in self.scenarios.values())
     
     def get_scenario(self, scenario_id: str) -> Optional[RetailScenario]:
         """Get a specific scenario by ID."""
@@ -251,6 +252,10 @@ class RetailScenarios:
         
         return random.choice(scenario.conversation_starters)
     
+    def available_ids(self) -> FrozenSet[str]:
+        """Get the IDs of all scenarios, as reported by list_all_scenarios."""
+        return self._available_ids
+    
     def list_all_scenarios(self) -> List[Dict[str, Any]]:
         """Get summary information for all scenarios."""
         return [
@@ -285,6 +290,12 @@ class RetailScenarios:
         }
 
 
+_retail_scenarios: Optional[RetailScenarios] = None
+
+
 def get_retail_scenarios() -> RetailScenarios:
-    """Get the retail scenarios manager."""
-    return RetailScenarios()
\ No newline at end of file
+    """Get the shared retail scenarios manager, building it on first use."""
+    global _retail_scenarios
+    if _retail_scenarios is None:
+        _retail_scenarios = RetailScenarios()
+    return _retail_scenarios
\ No newline at end of file
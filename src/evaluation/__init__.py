@@ -1,6 +1,6 @@
 """Evaluation framework components."""
 
-from .metrics import PassKMetric, SuccessRateMetric, PolicyComplianceMetric, ResponseQualityMetric
+from .metrics import PassKMetric, SuccessRateMetric, PolicyComplianceMetric, ResponseQualityMetric, evaluate_all
 from .runner import EvaluationRunner
 from .results import EvaluationResult, TaskResult, EvaluationReport
 
@@ -9,6 +9,7 @@ __all__ = [
     "SuccessRateMetric", 
     "PolicyComplianceMetric",
     "ResponseQualityMetric",
+    "evaluate_all",
     "EvaluationRunner",
     "EvaluationResult",
     "TaskResult",
@@ -1,9 +1,9 @@
 """Evaluation metrics for agent performance."""
 
-import math
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List
 
+import numpy as np
 from pydantic import BaseModel
 
 from ..utils.logging import get_logger
@@ -11,6 +11,71 @@ from ..utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+QUALITY_DIMENSIONS = ("relevance", "completeness", "clarity", "helpfulness")
+
+
+def _results_to_soa(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert result dicts into parallel columns for the metric kernels.
+    
+    Violations are flattened into one row per violation, with
+    ``violation_row`` pointing back at the result it belongs to.
+    """
+    task_index: Dict[str, int] = {}
+    task_ids = [task_index.setdefault(r.get("task_id", "default"), len(task_index)) for r in results]
+    
+    violation_rows = []
+    violation_types = []
+    violation_severities = []
+    for i, result in enumerate(results):
+        for violation in result.get("policy_violations", []):
+            violation_rows.append(i)
+            violation_types.append(violation.get("policy_type", "unknown"))
+            violation_severities.append(violation.get("severity", 1.0))
+    
+    return {
+        "success": np.fromiter((bool(r.get("success", False)) for r in results), dtype=bool, count=len(results)),
+        "task_id": np.array(task_ids, dtype=np.int64),
+        "n_tasks": len(task_index),
+        "quality": np.array(
+            [[r.get("quality_ratings", {}).get(dim, 0.5) for dim in QUALITY_DIMENSIONS] for r in results],
+            dtype=np.float64
+        ).reshape(len(results), len(QUALITY_DIMENSIONS)),
+        "violation_row": np.array(violation_rows, dtype=np.int64),
+        "violation_type": violation_types,
+        "violation_severity": np.array(violation_severities, dtype=np.float64)
+    }
+
+
+def _trial_rank(task_ids: np.ndarray, n_tasks: int) -> np.ndarray:
+    """Position of each result among the trials of its task, in result order."""
+    order = np.argsort(task_ids, kind="stable")
+    counts = np.bincount(task_ids, minlength=n_tasks)
+    starts = np.cumsum(counts) - counts
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order)) - np.repeat(starts, counts)
+    return rank
+
+
+def _pass_k(success: np.ndarray, task_ids: np.ndarray, rank: np.ndarray, n_tasks: int, k: int) -> float:
+    """Mean pass@k over tasks with at least k trials, using each task's first k trials.
+    
+    With n = k samples, 1 - C(n - c, k) / C(n, k) is 1 for any c > 0 successes,
+    so a task passes when any of its first k trials succeeded.
+    """
+    eligible = np.bincount(task_ids, minlength=n_tasks) >= k
+    if not eligible.any():
+        return 0.0
+    passed = np.bincount(task_ids[success & (rank < k)], minlength=n_tasks) > 0
+    return float(passed[eligible].mean())
+
+
+def _compliance_scores(n_results: int, violation_rows: np.ndarray, penalties: np.ndarray) -> np.ndarray:
+    """Per-result compliance: 1.0 minus each violation's penalty, floored at 0."""
+    scores = np.ones(n_results)
+    np.subtract.at(scores, violation_rows, penalties)
+    return np.maximum(scores, 0.0, out=scores)
+
+
 class MetricResult(BaseModel):
     """Result of a metric evaluation."""
     name: str
@@ -21,29 +86,40 @@ class MetricResult(BaseModel):
 class BaseMetric(ABC):
     """Abstract base class for evaluation metrics."""
     
-    @abstractmethod
     def calculate(self, results: List[Dict[str, Any]]) -> MetricResult:
         """Calculate the metric value from evaluation results."""
+        return self.calculate_columns(_results_to_soa(results))
+    
+    @abstractmethod
+    def calculate_columns(self, columns: Dict[str, Any]) -> MetricResult:
+        """Calculate the metric value from results already converted by ``_results_to_soa``."""
         pass
 
 
+def evaluate_all(results: List[Dict[str, Any]], metrics: Dict[str, BaseMetric]) -> Dict[str, MetricResult]:
+    """Calculate several metrics over the same results with a single conversion pass."""
+    columns = _results_to_soa(results)
+    return {name: metric.calculate_columns(columns) for name, metric in metrics.items()}
+
+
 class SuccessRateMetric(BaseMetric):
     """Basic success rate metric."""
     
-    def calculate(self, results: List[Dict[str, Any]]) -> MetricResult:
+    def calculate_columns(self, columns: Dict[str, Any]) -> MetricResult:
         """Calculate success rate as percentage of successful completions."""
-        if not results:
+        success = columns["success"]
+        if not len(success):
             return MetricResult(name="success_rate", value=0.0)
         
-        successful = sum(1 for r in results if r.get("success", False))
-        rate = successful / len(results)
+        successful = int(np.count_nonzero(success))
+        rate = successful / len(success)
         
         return MetricResult(
             name="success_rate",
             value=rate,
             details={
                 "successful": successful,
-                "total": len(results),
+                "total": len(success),
                 "percentage": rate * 100
             }
         )
@@ -55,53 +131,20 @@ class PassKMetric(BaseMetric):
     def __init__(self, k_values: List[int] = None):
         self.k_values = k_values or [1, 3, 5, 8, 10]
     
-    def calculate(self, results: List[Dict[str, Any]]) -> MetricResult:
+    def calculate_columns(self, columns: Dict[str, Any]) -> MetricResult:
         """Calculate Pass@K for different values of K."""
-        if not results:
+        if not len(columns["success"]):
             return MetricResult(name="pass_k", value=0.0)
         
         # Group results by task_id to get multiple trials per task
-        task_groups = {}
-        for result in results:
-            task_id = result.get("task_id", "default")
-            if task_id not in task_groups:
-                task_groups[task_id] = []
-            task_groups[task_id].append(result.get("success", False))
+        task_ids = columns["task_id"]
+        n_tasks = columns["n_tasks"]
+        rank = _trial_rank(task_ids, n_tasks)
         
-        pass_k_values = {}
-        
-        for k in self.k_values:
-            if not task_groups:
-                pass_k_values[f"pass@{k}"] = 0.0
-                continue
-                
-            task_pass_rates = []
-            
-            for task_id, trials in task_groups.items():
-                # Only consider tasks with at least k trials
-                if len(trials) < k:
-                    continue
-                    
-                # Calculate pass@k for this task
-                n_success = sum(trials[:k])  # Take first k trials
-                n_total = k
-                
-                # pass@k = probability of at least one success in k trials
-                # = 1 - P(all k trials fail)
-                if n_success == 0:
-                    task_pass_k = 0.0
-                elif n_success == k:
-                    task_pass_k = 1.0
-                else:
-                    # Use binomial coefficient calculation
-                    task_pass_k = 1.0 - self._binomial_prob_all_fail(n_success, n_total, k)
-                
-                task_pass_rates.append(task_pass_k)
-            
-            if task_pass_rates:
-                pass_k_values[f"pass@{k}"] = sum(task_pass_rates) / len(task_pass_rates)
-            else:
-                pass_k_values[f"pass@{k}"] = 0.0
+        pass_k_values = {
+            f"pass@{k}": _pass_k(columns["success"], task_ids, rank, n_tasks, k)
+            for k in self.k_values
+        }
         
         # Use the maximum k value as the primary metric
         primary_k = max(self.k_values)
@@ -112,27 +155,10 @@ class PassKMetric(BaseMetric):
             value=primary_value,
             details={
                 "pass_k_values": pass_k_values,
-                "tasks_evaluated": len(task_groups),
+                "tasks_evaluated": n_tasks,
                 "k_values": self.k_values
             }
         )
-    
-    def _binomial_prob_all_fail(self, n_success: int, n_total: int, k: int) -> float:
-        """Calculate probability that all k samples fail."""
-        if n_success >= k:
-            return 0.0
-        if n_success == 0:
-            return 1.0
-            
-        # P(all k fail) = C(n_total-n_success, k) / C(n_total, k)
-        try:
-            prob_all_fail = (
-                math.comb(n_total - n_success, k) / 
-                math.comb(n_total, k)
-            )
-            return min(1.0, prob_all_fail)
-        except (ValueError, ZeroDivisionError):
-            return 1.0 if n_success == 0 else 0.0
 
 
 class PolicyComplianceMetric(BaseMetric):
@@ -141,35 +167,25 @@ class PolicyComplianceMetric(BaseMetric):
     def __init__(self, policy_weights: Dict[str, float] = None):
         self.policy_weights = policy_weights or {}
     
-    def calculate(self, results: List[Dict[str, Any]]) -> MetricResult:
+    def calculate_columns(self, columns: Dict[str, Any]) -> MetricResult:
         """Calculate policy compliance rate."""
-        if not results:
+        n_results = len(columns["success"])
+        if not n_results:
             return MetricResult(name="policy_compliance", value=0.0)
         
-        compliance_scores = []
-        policy_violations = {}
+        violation_types = columns["violation_type"]
         
-        for result in results:
-            violations = result.get("policy_violations", [])
-            conversation_score = 1.0
-            
-            for violation in violations:
-                policy_type = violation.get("policy_type", "unknown")
-                severity = violation.get("severity", 1.0)
-                
-                # Apply weight if specified
-                weight = self.policy_weights.get(policy_type, 1.0)
-                penalty = severity * weight
-                conversation_score = max(0.0, conversation_score - penalty)
-                
-                # Track violation counts
-                if policy_type not in policy_violations:
-                    policy_violations[policy_type] = 0
-                policy_violations[policy_type] += 1
-            
-            compliance_scores.append(conversation_score)
+        # Apply weight if specified
+        weights = np.array([self.policy_weights.get(t, 1.0) for t in violation_types], dtype=np.float64)
+        scores = _compliance_scores(n_results, columns["violation_row"], columns["violation_severity"] * weights)
         
-        average_compliance = sum(compliance_scores) / len(compliance_scores)
+        # Track violation counts
+        policy_violations = {}
+        for policy_type in violation_types:
+            policy_violations[policy_type] = policy_violations.get(policy_type, 0) + 1
+        
+        compliance_scores = scores.tolist()
+        average_compliance = float(scores.mean())
         
         return MetricResult(
             name="policy_compliance",
@@ -177,8 +193,8 @@ class PolicyComplianceMetric(BaseMetric):
             details={
                 "compliance_scores": compliance_scores,
                 "policy_violations": policy_violations,
-                "total_conversations": len(results),
-                "perfect_compliance_count": sum(1 for s in compliance_scores if s == 1.0)
+                "total_conversations": n_results,
+                "perfect_compliance_count": int(np.count_nonzero(scores == 1.0))
             }
         )
 
@@ -186,44 +202,20 @@ class PolicyComplianceMetric(BaseMetric):
 class ResponseQualityMetric(BaseMetric):
     """Metric for measuring response quality and appropriateness."""
     
-    def calculate(self, results: List[Dict[str, Any]]) -> MetricResult:
+    def calculate_columns(self, columns: Dict[str, Any]) -> MetricResult:
         """Calculate response quality score."""
-        if not results:
+        # Quality ratings per dimension; missing ratings default to the middle score
+        quality = columns["quality"]
+        if not len(quality):
             return MetricResult(name="response_quality", value=0.0)
         
-        quality_scores = []
-        quality_dimensions = {
-            "relevance": [],
-            "completeness": [],
-            "clarity": [],
-            "helpfulness": []
-        }
-        
-        for result in results:
-            # Extract quality ratings from result
-            quality = result.get("quality_ratings", {})
-            
-            # Calculate overall quality score
-            dimension_scores = []
-            for dimension in quality_dimensions.keys():
-                score = quality.get(dimension, 0.5)  # Default to middle score
-                quality_dimensions[dimension].append(score)
-                dimension_scores.append(score)
-            
-            if dimension_scores:
-                overall_score = sum(dimension_scores) / len(dimension_scores)
-            else:
-                overall_score = 0.5
-                
-            quality_scores.append(overall_score)
-        
-        average_quality = sum(quality_scores) / len(quality_scores)
+        # Overall quality score per response
+        scores = quality.mean(axis=1)
+        quality_scores = scores.tolist()
+        average_quality = float(scores.mean())
         
         # Calculate dimension averages
-        dimension_averages = {
-            dim: sum(scores) / len(scores) if scores else 0.0
-            for dim, scores in quality_dimensions.items()
-        }
+        dimension_averages = dict(zip(QUALITY_DIMENSIONS, quality.mean(axis=0).tolist()))
         
         return MetricResult(
             name="response_quality",
@@ -231,6 +223,6 @@ class ResponseQualityMetric(BaseMetric):
             details={
                 "quality_scores": quality_scores,
                 "dimension_averages": dimension_averages,
-                "total_responses": len(results)
+                "total_responses": len(quality)
             }
         )
\ No newline at end of file
@@ -3,12 +3,18 @@
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import orjson
 from pydantic import BaseModel
 
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
 
 class TaskResult(BaseModel):
     """Result for a single task/conversation."""
@@ -51,17 +57,27 @@ class EvaluationResult(BaseModel):
     
     def get_success_rate_by_model(self) -> Dict[str, float]:
         """Calculate success rate for each model."""
-        model_success_rates = {}
+        model_index = {model: i for i, model in enumerate(self.models_evaluated)}
+        n_models = len(self.models_evaluated)
         
-        for model in self.models_evaluated:
-            model_results = self.get_results_by_model(model)
-            if model_results:
-                success_count = sum(1 for r in model_results if r.get("success", False))
-                model_success_rates[model] = success_count / len(model_results)
-            else:
-                model_success_rates[model] = 0.0
+        # Results from models outside models_evaluated get index n_models and are ignored
+        model_ids = np.fromiter(
+            (model_index.get(r.get("model_name"), n_models) for r in self.results),
+            dtype=np.int64, count=len(self.results)
+        )
+        success = np.fromiter(
+            (bool(r.get("success", False)) for r in self.results),
+            dtype=bool, count=len(self.results)
+        )
+        
+        totals = np.bincount(model_ids, minlength=n_models + 1)
+        successes = np.bincount(model_ids, weights=success, minlength=n_models + 1)
         
-        return model_success_rates
+        return {
+            model: float(successes[model_index[model]] / totals[model_index[model]])
+            if totals[model_index[model]] else 0.0
+            for model in self.models_evaluated
+        }
     
     def get_success_rate_by_scenario(self) -> Dict[str, float]:
         """Calculate success rate for each scenario."""
@@ -166,12 +182,10 @@ class EvaluationResult(BaseModel):
             "scenarios_evaluated": len(self.scenarios_evaluated)
         }
     
-    def export_to_json(self) -> str:
-        """Export evaluation results to JSON format."""
-        import json
-        
+    def _export_data(self) -> Dict[str, Any]:
+        """Collect the evaluation results and summaries for JSON export."""
         # Convert datetime objects to strings for JSON serialization
-        export_data = {
+        return {
             "evaluation_id": self.evaluation_id,
             "start_time": self.start_time.isoformat(),
             "end_time": self.end_time.isoformat(),
@@ -199,13 +213,17 @@ class EvaluationResult(BaseModel):
                 "tool_usage": self.get_tool_usage_summary()
             }
         }
-        
-        return json.dumps(export_data, indent=2, default=str)
+    
+    def _export_bytes(self) -> bytes:
+        return orjson.dumps(self._export_data(), default=str, option=_JSON_OPTIONS)
+    
+    def export_to_json(self) -> str:
+        """Export evaluation results to JSON format."""
+        return self._export_bytes().decode()
     
     def save_to_file(self, filepath: str) -> None:
         """Save evaluation results to a file."""
-        with open(filepath, 'w') as f:
-            f.write(self.export_to_json())
+        Path(filepath).write_bytes(self._export_bytes())
         
         logger.info(f"Evaluation results saved to {filepath}")
 
@@ -11,7 +11,7 @@ from ..agents.base import Message
 from ..domains.retail.tools import RetailTools, get_retail_tools
 from ..domains.retail.policies import get_retail_policy_checker
 from ..domains.retail.scenarios import get_retail_scenarios
-from .metrics import PassKMetric, SuccessRateMetric, PolicyComplianceMetric, ResponseQualityMetric
+from .metrics import PassKMetric, SuccessRateMetric, PolicyComplianceMetric, ResponseQualityMetric, evaluate_all
 from .results import EvaluationResult, TaskResult
 from ..utils.logging import get_logger
 from ..utils.config import get_config
@@ -53,6 +53,7 @@ class EvaluationRunner:
             scenario_ids = list(self.scenarios.scenarios.keys())
         
         start_time = datetime.now()
+        t0 = time.perf_counter()
         all_results = []
         
         for model_name in model_names:
@@ -93,14 +94,11 @@ class EvaluationRunner:
         
         # Calculate overall metrics
         end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
+        duration = time.perf_counter() - t0
         
-        # Group results for metric calculation
-        metric_results = {}
-        for metric_name, metric in self.metrics.items():
-            logger.info(f"Calculating {metric_name} metric")
-            metric_result = metric.calculate(all_results)
-            metric_results[metric_name] = metric_result
+        # Calculate every metric from one columnar view of the results
+        logger.info(f"Calculating metrics: {', '.join(self.metrics)}")
+        metric_results = evaluate_all(all_results, self.metrics)
         
         evaluation_result = EvaluationResult(
             evaluation_id=f"eval_{int(time.time())}",
@@ -138,6 +136,7 @@ class EvaluationRunner:
             raise ValueError(f"Scenario not found: {scenario_id}")
         
         conversation_start = datetime.now()
+        t0 = time.perf_counter()
         conversation_history = []
         tools_used = []
         policy_violations = []
@@ -203,8 +202,7 @@ class EvaluationRunner:
                 completion_reason = f"error: {str(e)}"
                 break
         
-        conversation_end = datetime.now()
-        duration = (conversation_end - conversation_start).total_seconds()
+        duration = time.perf_counter() - t0
         
         # Create result
         result = {